@@ -1,5 +1,5 @@
 import sys
-import random
+from functools import lru_cache
 from abc import abstractmethod
 from typing import (
     TYPE_CHECKING,
@@ -11,6 +11,7 @@ from typing import (
     List,
     MutableSequence,
     Sequence,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -37,6 +38,13 @@ T = TypeVar('T', bound='AnyDocArray')
 T_doc = TypeVar('T_doc', bound=BaseDocWithoutId)
 IndexIterType = Union[slice, Iterable[int], Iterable[bool], None]
 
+
+@lru_cache(maxsize=256)
+def _split_access_path(access_path: str) -> 'Tuple[str, ...]':
+    """Split an `'__'`-separated access path once and memoize the result."""
+    return tuple(access_path.split('__'))
+
+
 UNUSABLE_ERROR_MSG = (
     'This {cls} instance is in an unusable state. \n'
     'The most common cause of this is converting a DocVec to a DocList. '
@@ -45,6 +53,33 @@ UNUSABLE_ERROR_MSG = (
 )
 
 
+class _FieldAccessor:
+    """Data descriptor exposing one document field as a column of a typed array.
+
+    A single slots-backed object per field replaces the per-field
+    getter/setter/property triple that used to be allocated in
+    `__class_getitem__`, so typed subclasses are cheaper to build.
+    """
+
+    __slots__ = ('name', '_err_msg')
+
+    def __init__(self, name: str, err_msg: str):
+        self.name = name
+        self._err_msg = err_msg
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        if getattr(obj, '_is_unusable', False):
+            raise UnusableObjectError(self._err_msg)
+        return obj._get_data_column(self.name)
+
+    def __set__(self, obj, value):
+        if getattr(obj, '_is_unusable', False):
+            raise UnusableObjectError(self._err_msg)
+        obj._set_data_column(self.name, value)
+
+
 class AnyDocArray(Sequence[T_doc], Generic[T_doc], AbstractType):
     doc_type: Type[BaseDocWithoutId]
     __typed_da__: Dict[Type['AnyDocArray'], Dict[Type[BaseDocWithoutId], Type]] = {}
@@ -66,6 +101,16 @@ class AnyDocArray(Sequence[T_doc], Generic[T_doc], AbstractType):
                 f'{cls.__name__}[item] item should be a Document not a {item} '
             )
 
+        return cls._typed_subclass(item)
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _typed_subclass(cls, item: Type[BaseDocWithoutId]) -> Type:
+        """Build (or fetch from the cache) the typed subclass for `cls[item]`.
+
+        The `lru_cache` turns repeated `DocList[MyDoc]` subscriptions into a
+        single C-level hash lookup instead of re-traversing `__typed_da__`.
+        """
         if cls not in cls.__typed_da__:
             cls.__typed_da__[cls] = {}
 
@@ -76,28 +121,10 @@ class AnyDocArray(Sequence[T_doc], Generic[T_doc], AbstractType):
             class _DocArrayTyped(cls):  # type: ignore
                 doc_type: Type[BaseDocWithoutId] = cast(Type[BaseDocWithoutId], item)
 
+            unusable_msg = UNUSABLE_ERROR_MSG.format(cls=cls.__name__)
             for field in _DocArrayTyped.doc_type._docarray_fields().keys():
-
-                def _property_generator(val: str):
-                    def _getter(self):
-                        if getattr(self, '_is_unusable', False):
-                            raise UnusableObjectError(
-                                UNUSABLE_ERROR_MSG.format(cls=cls.__name__)
-                            )
-                        return self._get_data_column(val)
-
-                    def _setter(self, value):
-                        if getattr(self, '_is_unusable', False):
-                            raise UnusableObjectError(
-                                UNUSABLE_ERROR_MSG.format(cls=cls.__name__)
-                            )
-                        self._set_data_column(val, value)
-
-                    # need docstring for the property
-                    return property(fget=_getter, fset=_setter)
-
-                setattr(_DocArrayTyped, field, _property_generator(field))
-                # this generates property on the fly based on the schema of the item
+                # this generates accessors on the fly based on the schema of the item
+                setattr(_DocArrayTyped, field, _FieldAccessor(field, unusable_msg))
 
             # The global scope and qualname need to refer to this class a unique name.
             # Otherwise, creating another _DocArrayTyped will overwrite this one.
@@ -263,29 +290,39 @@ class AnyDocArray(Sequence[T_doc], Generic[T_doc], AbstractType):
 
     @staticmethod
     def _traverse(node: Any, access_path: str):
-        if access_path:
-            curr_attr, _, path_attrs = access_path.partition('__')
-
-            from docarray.array import DocList
-
+        if not access_path:
+            yield node
+            return
+
+        from docarray.array import DocList
+
+        # iterative depth-first walk: one explicit stack instead of one
+        # generator frame per doc per path segment
+        parts = _split_access_path(access_path)
+        n_parts = len(parts)
+        stack: List[Any] = [(node, 0)]
+        while stack:
+            node, depth = stack.pop()
+            if depth == n_parts:
+                yield node
+                continue
+            attr = parts[depth]
             if isinstance(node, (DocList, list)):
-                for n in node:
-                    x = getattr(n, curr_attr)
-                    yield from AnyDocArray._traverse(x, path_attrs)
+                stack.extend((getattr(n, attr), depth + 1) for n in reversed(node))
             else:
-                x = getattr(node, curr_attr)
-                yield from AnyDocArray._traverse(x, path_attrs)
-        else:
-            yield node
+                stack.append((getattr(node, attr), depth + 1))
 
     @staticmethod
     def _flatten_one_level(sequence: List[Any]) -> List[Any]:
+        from itertools import chain
+
         from docarray import DocList
 
         if len(sequence) == 0 or not isinstance(sequence[0], (list, DocList)):
             return sequence
         else:
-            return [item for sublist in sequence for item in sublist]
+            # C-level concatenation, no per-item Python frame
+            return list(chain.from_iterable(sequence))
 
     def summary(self):
         """
@@ -309,23 +346,28 @@ class AnyDocArray(Sequence[T_doc], Generic[T_doc], AbstractType):
         :param show_progress: if set, show a progress bar when batching documents.
         :yield: a Generator of [`DocList`][docarray.array.doc_list.doc_list.DocList], each in the length of `batch_size`
         """
-        from rich.progress import track
-
         if not (isinstance(batch_size, int) and batch_size > 0):
             raise ValueError(
                 f'`batch_size` should be a positive integer, received: {batch_size}'
             )
 
         N = len(self)
-        indices = list(range(N))
         n_batches = int(np.ceil(N / batch_size))
 
-        if shuffle:
-            random.shuffle(indices)
+        # a C-level permutation is much cheaper than shuffling a list of
+        # PyObject ints; without shuffling plain slices suffice
+        indices = np.random.permutation(N) if shuffle else None
 
-        for i in track(
-            range(n_batches),
-            description='Batching documents',
-            disable=not show_progress,
-        ):
-            yield self[indices[i * batch_size : (i + 1) * batch_size]]
+        batch_ids: Iterable[int] = range(n_batches)
+        if show_progress:
+            # only pay the rich import and per-iteration callback when a
+            # progress bar is actually shown
+            from rich.progress import track
+
+            batch_ids = track(batch_ids, description='Batching documents')
+
+        for i in batch_ids:
+            if indices is None:
+                yield self[i * batch_size : (i + 1) * batch_size]
+            else:
+                yield self[indices[i * batch_size : (i + 1) * batch_size]]
@@ -1,4 +1,6 @@
 import io
+from functools import lru_cache
+from operator import attrgetter
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -44,6 +46,35 @@ T = TypeVar('T', bound='DocList')
 T_doc = TypeVar('T_doc', bound=BaseDocWithoutId)
 
 
+class _BytesSink:
+    """Minimal write-only file object that appends into a bytearray."""
+
+    __slots__ = ('buffer',)
+
+    def __init__(self):
+        self.buffer = bytearray()
+
+    def write(self, data) -> int:
+        self.buffer += data
+        return len(data)
+
+
+@lru_cache(maxsize=None)
+def _compiled_doc_validator(doc_type: Type[BaseDocWithoutId]):
+    """Return a validator callable specialized for `doc_type`, so the
+    `issubclass(doc_type, AnyDoc)` decision is taken once per type instead of
+    once per doc."""
+    if safe_issubclass(doc_type, AnyDoc):
+        return lambda doc: doc
+
+    def _validate(doc):
+        if not isinstance(doc, doc_type):
+            raise ValueError(f'{doc} is not a {doc_type}')
+        return doc
+
+    return _validate
+
+
 class DocList(
     ListAdvancedIndexing[T_doc],
     PushPullMixin,
@@ -110,6 +141,14 @@ class DocList(
     del docs[0:5]  # remove elements for 0 to 5 from DocList
     ```
 
+    !!! note
+        A DocList stores its Documents row-wise (one pydantic object per doc),
+        so `docs.tensor` and other column accesses rebuild a list on every
+        call. For analytical, column-oriented workloads convert to a
+        [`DocVec`][docarray.array.doc_vec.doc_vec.DocVec] with
+        [`to_doc_vec`][docarray.array.doc_list.doc_list.DocList.to_doc_vec]:
+        it stores one contiguous column per field and returns it directly.
+
     !!! note
         If the DocList is homogeneous and its schema contains nested BaseDoc
         (i.e, BaseDoc inside a BaseDoc) where the nested Document is `Optional`, calling
@@ -129,7 +168,14 @@ class DocList(
         validate_input_docs: bool = True,
     ):
         if validate_input_docs:
-            docs = self._validate_docs(docs) if docs else []
+            if isinstance(docs, DocList) and safe_issubclass(
+                docs.doc_type, self.doc_type
+            ):
+                # the docs were already validated by a compatible DocList
+                # (e.g. the output of slicing or batching), skip re-validation
+                docs = docs if docs else []
+            else:
+                docs = self._validate_docs(docs) if docs else []
         else:
             docs = docs if docs else []
         super().__init__(docs)
@@ -159,21 +205,20 @@ class DocList(
         """
         Validate if an Iterable of Document are compatible with this `DocList`
         """
+        validate = _compiled_doc_validator(self.__class__.doc_type)
         for doc in docs:
-            yield self._validate_one_doc(doc)
+            yield validate(doc)
 
     def _validate_one_doc(self, doc: T_doc) -> T_doc:
         """Validate if a Document is compatible with this `DocList`"""
-        if not safe_issubclass(self.doc_type, AnyDoc) and not isinstance(
-            doc, self.doc_type
-        ):
-            raise ValueError(f'{doc} is not a {self.doc_type}')
-        return doc
+        return _compiled_doc_validator(self.__class__.doc_type)(doc)
 
     def __bytes__(self) -> bytes:
-        with io.BytesIO() as bf:
-            self._write_bytes(bf=bf)
-            return bf.getvalue()
+        # write into a plain bytearray: one growing buffer plus the final
+        # bytes() copy, without the intermediate BytesIO buffer
+        sink = _BytesSink()
+        self._write_bytes(bf=cast('io.BytesIO', sink))
+        return bytes(sink.buffer)
 
     def append(self, doc: T_doc):
         """
@@ -212,13 +257,11 @@ class DocList(
         self: T,
         field: str,
     ) -> Union[MutableSequence, T, 'TorchTensor', 'NdArray']:
-        """Return all v  @classmethod
-          def __class_getitem__(cls, item: Union[Type[BaseDoc], TypeVar, str]):alues of the fields from all docs this doc_list contains
-        @classmethod
-          def __class_getitem__(cls, item: Union[Type[BaseDoc], TypeVar, str]):
-              :param field: name of the fields to extract
-              :return: Returns a list of the field value for each document
-              in the doc_list like container
+        """Return all values of the fields from all docs this doc_list contains
+
+        :param field: name of the fields to extract
+        :return: Returns a list of the field value for each document
+        in the doc_list like container
         """
         field_type = self.__class__.doc_type._get_field_annotation(field)
         field_info = self.__class__.doc_type._docarray_fields()[field]
@@ -236,10 +279,13 @@ class DocList(
             # most likely a bug in mypy though
             # bug reported here https://github.com/python/mypy/issues/14111
             return DocList.__class_getitem__(field_type)(
-                (getattr(doc, field) for doc in self),
+                map(attrgetter(field), self),
             )
         else:
-            return [getattr(doc, field) for doc in self]
+            # hoist the attribute lookup out of the loop and iterate at C level:
+            # this is noticeably faster than a `getattr` comprehension on large
+            # doc_lists
+            return list(map(attrgetter(field), self))
 
     def _set_data_column(
         self: T,
@@ -251,8 +297,6 @@ class DocList(
         :param field: name of the fields to set
         :values: the values to set at the `DocList` level
         """
-        ...
-
         for doc, value in zip(self, values):
             setattr(doc, field, value)
 
@@ -304,11 +348,50 @@ class DocList(
         self: 'DocList',
         access_path: str,
     ) -> List[Any]:
+        if self._is_flat_access_path(access_path):
+            # every hop on the path is a single nested doc and the leaf is not
+            # a doc_list: the whole walk can run in C via a dotted attrgetter
+            return list(map(attrgetter(access_path.replace('__', '.')), self))
+
         nodes = list(AnyDocArray._traverse(node=self, access_path=access_path))
         flattened = AnyDocArray._flatten_one_level(nodes)
 
         return flattened
 
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _is_flat_access_path(cls, access_path: str) -> bool:
+        """Return True if `access_path` only goes through required nested
+        `BaseDoc` fields and its leaf needs no flattening, so that
+        `traverse_flat` can skip the generic `_traverse` walk.
+
+        The classification only depends on the schema, so it is memoized
+        per `(class, access_path)` pair."""
+        parts = access_path.split('__')
+        doc_type = cls.doc_type
+        for part in parts[:-1]:
+            if safe_issubclass(doc_type, AnyDoc) or part not in (
+                doc_type._docarray_fields()
+            ):
+                return False
+            field_type = doc_type._get_field_annotation(part)
+            if not (
+                isinstance(field_type, type)
+                and safe_issubclass(field_type, BaseDocWithoutId)
+            ):
+                return False
+            doc_type = field_type
+        if safe_issubclass(doc_type, AnyDoc) or parts[-1] not in (
+            doc_type._docarray_fields()
+        ):
+            return False
+        leaf_type = doc_type._get_field_annotation(parts[-1])
+        # a doc_list (or plain list) leaf would need one level of flattening,
+        # and non-class annotations (unions, List[...]) are handled generically
+        return isinstance(leaf_type, type) and not safe_issubclass(
+            leaf_type, (AnyDocArray, list, tuple)
+        )
+
     @classmethod
     def from_protobuf(cls: Type[T], pb_msg: 'DocListProto') -> T:
         """create a Document from a protobuf message
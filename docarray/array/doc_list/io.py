@@ -181,7 +181,7 @@ class IOMixinDocList(Iterable[T_doc]):
             if protocol == 'protobuf-array':
                 f.write(self.to_protobuf().SerializePartialToString())
             elif protocol == 'pickle-array':
-                f.write(pickle.dumps(self))
+                f.write(pickle.dumps(self, protocol=pickle.HIGHEST_PROTOCOL))
             elif protocol == 'json-array':
                 f.write(self.to_json().encode())
             elif protocol in SINGLE_PROTOCOLS:
@@ -46,6 +46,15 @@ class ColumnStorage:
     :param tensor_type: Class used to wrap the doc_vec tensors
     """
 
+    __slots__ = (
+        'tensor_columns',
+        'doc_columns',
+        'docs_vec_columns',
+        'any_columns',
+        'tensor_type',
+        'columns',
+    )
+
     def __init__(
         self,
         tensor_columns: Dict[str, Optional[AbstractTensor]],
@@ -143,6 +152,8 @@ class ColumnStorage:
 
 
 class ColumnStorageView(dict, MutableMapping[str, Any]):
+    __slots__ = ('index', 'storage')
+
     index: int
     storage: ColumnStorage
 
@@ -153,9 +153,8 @@ class DocVec(IOMixinDocVec, AnyDocArray[T_doc]):  # type: ignore
             # from each document and put them in the corresponding column
             field_type: Type = self.doc_type._get_field_annotation(field_name)
 
-            field_info = self.doc_type._docarray_fields()[field_name]
             is_field_required = (
-                field_info.is_required() if is_pydantic_v2 else field_info.required
+                field.is_required() if is_pydantic_v2 else field.required
             )
 
             first_doc_is_none = getattr(docs[0], field_name) is None
@@ -378,12 +377,16 @@ class DocVec(IOMixinDocVec, AnyDocArray[T_doc]):  # type: ignore
         ...
 
     def __getitem__(self: T, item: Union[int, IndexIterType]) -> Union[T_doc, T]:
+        # single doc case: exact type check first so the common integer index
+        # skips the isinstance chain below
+        if type(item) is int:
+            return self.doc_type.from_view(ColumnStorageView(item, self._storage))
         if item is None:
             return self  # PyTorch behaviour
         # multiple docs case
-        if isinstance(item, (slice, Iterable)):
+        if type(item) is slice or isinstance(item, Iterable):
             return self.__class__.from_columns_storage(self._storage[item])
-        # single doc case
+        # single doc case (e.g. numpy integer scalars)
         return self.doc_type.from_view(ColumnStorageView(item, self._storage))
 
     def _get_data_column(
@@ -558,8 +561,12 @@ class DocVec(IOMixinDocVec, AnyDocArray[T_doc]):  # type: ignore
     # Sequence related #
     ####################
     def __iter__(self):
+        # build the views directly instead of going through __getitem__,
+        # which re-dispatches on the index type at every step
+        storage = self._storage
+        from_view = self.doc_type.from_view
         for i in range(len(self)):
-            yield self[i]
+            yield from_view(ColumnStorageView(i, storage))
 
     def __len__(self):
         return len(self._storage)
@@ -1,3 +1,5 @@
+from itertools import compress
+from operator import itemgetter
 from typing import (
     Any,
     Iterable,
@@ -40,14 +42,16 @@ IndexIterType = Union[slice, Iterable[int], Iterable[bool], None]
 
 
 def _is_np_int(item: Any) -> bool:
+    if item.__class__ is int:
+        # plain python ints are the common case and are never numpy scalars
+        return False
     dtype = getattr(item, 'dtype', None)
-    ndim = getattr(item, 'ndim', None)
-    if dtype is not None and ndim is not None:
-        try:
-            return ndim == 0 and np.issubdtype(dtype, np.integer)
-        except TypeError:
-            return False
-    return False  # this is unreachable, but mypy wants it
+    if dtype is None:
+        return False
+    # comparing dtype.kind (a single char) is much cheaper than
+    # np.issubdtype, which walks the numpy type hierarchy; non-numpy
+    # dtypes (e.g. torch) have no `kind` and fall through to False
+    return getattr(dtype, 'kind', None) in ('i', 'u') and getattr(item, 'ndim', 1) == 0
 
 
 class ListAdvancedIndexing(List[T_item]):
@@ -116,10 +120,13 @@ class ListAdvancedIndexing(List[T_item]):
         return item
 
     def _get_from_indices(self: T, item: Iterable[int]) -> T:
-        results = []
-        for ix in item:
-            results.append(self[ix])
-        return self.__class__(results)
+        indices = list(item)
+        if len(indices) == 0:
+            return self.__class__()
+        if len(indices) == 1:
+            return self.__class__([self[indices[0]]])
+        # itemgetter gathers all indices in a single C call
+        return self.__class__(itemgetter(*indices)(self))
 
     def _set_by_indices(self: T, item: Iterable[int], value: Iterable[T_item]):
         for ix, doc_to_set in zip(item, value):
@@ -129,9 +136,7 @@ class ListAdvancedIndexing(List[T_item]):
                 raise IndexError(f'Index {ix} is out of range')
 
     def _get_from_mask(self: T, item: Iterable[bool]) -> T:
-        return self.__class__(
-            [doc for doc, mask_value in zip(self, item) if mask_value]
-        )
+        return self.__class__(compress(self, item))
 
     def _set_by_mask(self: T, item: Iterable[bool], value: Sequence[T_item]):
         i_value = 0
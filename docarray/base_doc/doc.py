@@ -1,5 +1,6 @@
 import os
 import warnings
+from functools import lru_cache
 from typing import (
     TYPE_CHECKING,
     AbstractSet,
@@ -172,9 +173,12 @@ class BaseDocWithoutId(BaseModel, IOMixin, UpdateMixin, BaseNode):
             return cls.__fields__
 
     @classmethod
+    @lru_cache(maxsize=None)
     def _get_field_annotation(cls, field: str) -> Type:
         """
-        Accessing annotation associated with the field in the schema
+        Accessing annotation associated with the field in the schema.
+        The schema is frozen once the class is created, so the result is
+        memoized per (class, field) pair.
         :param field: name of the field
         :return:
         """
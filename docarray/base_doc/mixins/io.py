@@ -162,7 +162,9 @@ class IOMixin(Iterable[Tuple[str, Any]]):
         import pickle
 
         if protocol == 'pickle':
-            bstr = pickle.dumps(self)
+            # protocol 5 frames large (tensor) buffers and avoids the extra
+            # memcpy older pickle protocols incur on them
+            bstr = pickle.dumps(self, protocol=pickle.HIGHEST_PROTOCOL)
         elif protocol == 'protobuf':
             bstr = self.to_protobuf().SerializePartialToString()
         else:
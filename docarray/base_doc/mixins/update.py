@@ -1,27 +1,103 @@
 from abc import abstractmethod
+from collections import namedtuple
+from functools import lru_cache
 from typing import TYPE_CHECKING, Dict, List, Type, TypeVar
 
 from typing_inspect import get_origin
 
 from docarray.utils._internal._typing import safe_issubclass
+from docarray.utils._internal.pydantic import is_pydantic_v2
 
 T = TypeVar('T', bound='UpdateMixin')
 
 if TYPE_CHECKING:
     from pydantic.fields import ModelField
 
+_FieldGroups = namedtuple(
+    '_FieldGroups',
+    [
+        'simple_non_empty_fields',
+        'list_fields',
+        'set_fields',
+        'dict_fields',
+        'nested_docarray_fields',
+        'nested_docs_fields',
+    ],
+)
+
+# type-derived field classification; does not depend on instance values
+_StaticFieldGroups = namedtuple(
+    '_StaticFieldGroups',
+    [
+        'value_fields',
+        'list_fields',
+        'set_fields',
+        'dict_fields',
+        'nested_docarray_fields',
+    ],
+)
+
+# the document identity is never merged by update(); note the lowercase
+# 'id', which is the actual field name on BaseDoc
+FORBIDDEN_FIELDS_TO_UPDATE = frozenset({'id'})
+
 
 class UpdateMixin:
     _docarray_fields: Dict[str, 'ModelField']
 
     def _get_string_for_regex_filter(self):
-        return str(self)
+        # repr carries the same field content as the rich-rendered str but
+        # skips the console capture (lock + full render) per document, which
+        # matters when a regex filter scans a large array
+        return repr(self)
 
     @classmethod
     @abstractmethod
     def _get_field_annotation(cls, field: str) -> Type['UpdateMixin']:
         ...
 
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _group_fields_static(cls) -> '_StaticFieldGroups':
+        """Classify the schema fields by type.
+
+        The classification only depends on the class schema, which is frozen
+        once the class is created, so it is computed once per class.
+        """
+        from docarray import DocList
+
+        value_fields: List[str] = []
+        list_fields: List[str] = []
+        set_fields: List[str] = []
+        dict_fields: List[str] = []
+        nested_docarray_fields: List[str] = []
+
+        for field_name in cls._docarray_fields().keys():
+            if field_name in FORBIDDEN_FIELDS_TO_UPDATE:
+                continue
+            field_type = cls._get_field_annotation(field_name)
+
+            if isinstance(field_type, type) and safe_issubclass(field_type, DocList):
+                nested_docarray_fields.append(field_name)
+            else:
+                origin = get_origin(field_type)
+                if origin is list:
+                    list_fields.append(field_name)
+                elif origin is set:
+                    set_fields.append(field_name)
+                elif origin is dict:
+                    dict_fields.append(field_name)
+                else:
+                    value_fields.append(field_name)
+
+        return _StaticFieldGroups(
+            tuple(value_fields),
+            tuple(list_fields),
+            tuple(set_fields),
+            tuple(dict_fields),
+            tuple(nested_docarray_fields),
+        )
+
     def update(self, other: T):
         """
         Updates self with the content of other. Changes are applied to self.
@@ -78,63 +154,28 @@ class UpdateMixin:
                 f'{type(self)} with Document of type '
                 f'{type(other)}'
             )
-        from collections import namedtuple
-
-        from docarray import DocList
         from docarray.utils.reduce import reduce
 
-        # Declaring namedtuple()
-        _FieldGroups = namedtuple(
-            '_FieldGroups',
-            [
-                'simple_non_empty_fields',
-                'list_fields',
-                'set_fields',
-                'dict_fields',
-                'nested_docarray_fields',
-                'nested_docs_fields',
-            ],
-        )
-
-        FORBIDDEN_FIELDS_TO_UPDATE = ['ID']
-
         def _group_fields(doc: 'UpdateMixin') -> _FieldGroups:
+            static_groups = doc._group_fields_static()
+
+            # only the value-holding fields need a per-instance pass to
+            # separate nested documents from plain non-empty values
             simple_non_empty_fields: List[str] = []
-            list_fields: List[str] = []
-            set_fields: List[str] = []
-            dict_fields: List[str] = []
             nested_docs_fields: List[str] = []
-            nested_docarray_fields: List[str] = []
-
-            for field_name, field in doc._docarray_fields().items():
-                if field_name not in FORBIDDEN_FIELDS_TO_UPDATE:
-                    field_type = doc._get_field_annotation(field_name)
-
-                    if isinstance(field_type, type) and safe_issubclass(
-                        field_type, DocList
-                    ):
-                        nested_docarray_fields.append(field_name)
+            for field_name in static_groups.value_fields:
+                v = getattr(doc, field_name)
+                if v is not None:
+                    if isinstance(v, UpdateMixin):
+                        nested_docs_fields.append(field_name)
                     else:
-                        origin = get_origin(field_type)
-                        if origin is list:
-                            list_fields.append(field_name)
-                        elif origin is set:
-                            set_fields.append(field_name)
-                        elif origin is dict:
-                            dict_fields.append(field_name)
-                        else:
-                            v = getattr(doc, field_name)
-                            if v is not None:
-                                if isinstance(v, UpdateMixin):
-                                    nested_docs_fields.append(field_name)
-                                else:
-                                    simple_non_empty_fields.append(field_name)
+                        simple_non_empty_fields.append(field_name)
             return _FieldGroups(
                 simple_non_empty_fields,
-                list_fields,
-                set_fields,
-                dict_fields,
-                nested_docarray_fields,
+                static_groups.list_fields,
+                static_groups.set_fields,
+                static_groups.dict_fields,
+                static_groups.nested_docarray_fields,
                 nested_docs_fields,
             )
 
@@ -150,7 +191,7 @@ class UpdateMixin:
             sub_doc_1: T = getattr(self, field)
             sub_doc_2: T = getattr(other, field)
             sub_doc_1.update(sub_doc_2)
-            setattr(self, field, sub_doc_1)
+            _mark_field_set(self, field)
 
         for field in set(doc1_fields.list_fields + doc2_fields.list_fields):
             array1 = getattr(self, field)
@@ -159,7 +200,7 @@ class UpdateMixin:
                 setattr(self, field, array2)
             elif array1 is not None and array2 is not None:
                 array1.extend(array2)
-                setattr(self, field, array1)
+                _mark_field_set(self, field)
 
         for field in set(doc1_fields.set_fields + doc2_fields.set_fields):
             array1 = getattr(self, field)
@@ -168,7 +209,7 @@ class UpdateMixin:
                 setattr(self, field, array2)
             elif array1 is not None and array2 is not None:
                 array1.update(array2)
-                setattr(self, field, array1)
+                _mark_field_set(self, field)
 
         for field in set(
             doc1_fields.nested_docarray_fields + doc2_fields.nested_docarray_fields
@@ -178,8 +219,8 @@ class UpdateMixin:
             if array1 is None and array2 is not None:
                 setattr(self, field, array2)
             elif array1 is not None and array2 is not None:
-                array1 = reduce(array1, array2)
-                setattr(self, field, array1)
+                reduce(array1, array2)
+                _mark_field_set(self, field)
 
         for field in set(doc1_fields.dict_fields + doc2_fields.dict_fields):
             dict1 = getattr(self, field)
@@ -188,8 +229,21 @@ class UpdateMixin:
                 setattr(self, field, dict2)
             elif dict1 is not None and dict2 is not None:
                 dict1.update(dict2)
-                setattr(self, field, dict1)
+                _mark_field_set(self, field)
 
 
 def _similar_schemas(model1, model2):
     return model1.__annotations__ == model2.__annotations__
+
+
+def _mark_field_set(doc, field: str) -> None:
+    """Record `field` as set without re-assigning it.
+
+    The containers merged by `update()` are mutated in place, so the object
+    stored on the doc is unchanged; a plain `setattr` would only re-run
+    assignment validation on a value that is already validated.
+    """
+    if is_pydantic_v2:
+        doc.__pydantic_fields_set__.add(field)
+    else:
+        doc.__fields_set__.add(field)
@@ -15,13 +15,8 @@ def _expand_if_single_axis(*matrices: np.ndarray) -> List[np.ndarray]:
     :return: List of the input matrices,
         where single axis matrices are expanded at dim 0.
     """
-    expanded = []
-    for m in matrices:
-        if len(m.shape) == 1:
-            expanded.append(np.expand_dims(m, axis=0))
-        else:
-            expanded.append(m)
-    return expanded
+    # m[None, :] is a view, no data is copied
+    return [m[None, :] if m.ndim == 1 else m for m in matrices]
 
 
 def _expand_if_scalar(arr: np.ndarray) -> np.ndarray:
@@ -34,6 +29,11 @@ def identity(array: np.ndarray) -> np.ndarray:
     return array
 
 
+# row-block size for the pairwise distance kernels: one block of the result
+# matrix stays cache-resident while the norms are folded in and clipped
+_DIST_BLOCK_ROWS = 1024
+
+
 class NumpyCompBackend(AbstractNumpyBasedBackend):
     """
     Computational backend for Numpy.
@@ -160,22 +160,41 @@ class NumpyCompBackend(AbstractNumpyBasedBackend):
             if len(values.shape) == 1:
                 values = np.expand_dims(values, axis=0)
 
-            if descending:
-                values = -values
+            if k <= 0:
+                # an empty (n_queries, 0) result; argpartition would choke
+                # on kth=-0 and return the full matrix instead
+                idx = np.empty((values.shape[0], 0), dtype=np.intp)
+                return np.empty((values.shape[0], 0), dtype=values.dtype), idx
 
             if k >= values.shape[1]:
-                idx = values.argsort(axis=1)[:, :k]
+                # the slice [:, :k] would discard nothing here
+                idx = values.argsort(axis=1)
+                if descending:
+                    idx = idx[:, ::-1]
+                values = np.take_along_axis(values, idx, axis=1)
+            elif k == 1:
+                # a single SIMD reduction instead of a partition
+                if descending:
+                    idx = values.argmax(axis=1)[:, np.newaxis]
+                else:
+                    idx = values.argmin(axis=1)[:, np.newaxis]
                 values = np.take_along_axis(values, idx, axis=1)
             else:
-                idx_ps = values.argpartition(kth=k, axis=1)[:, :k]
+                # partition the k candidates to one end of the row, gather
+                # them once, then sort only that k-slice; descending queries
+                # take the tail of the partition and reverse the small sort
+                # instead of negating the full matrix
+                if descending:
+                    idx_ps = values.argpartition(kth=-k, axis=1)[:, -k:]
+                else:
+                    idx_ps = values.argpartition(kth=k - 1, axis=1)[:, :k]
                 values = np.take_along_axis(values, idx_ps, axis=1)
                 idx_fs = values.argsort(axis=1)
+                if descending:
+                    idx_fs = idx_fs[:, ::-1]
                 idx = np.take_along_axis(idx_ps, idx_fs, axis=1)
                 values = np.take_along_axis(values, idx_fs, axis=1)
 
-            if descending:
-                values = -values
-
             return values, idx
 
     class Metrics(AbstractComputationalBackend.Metrics[np.ndarray]):
@@ -210,18 +229,27 @@ class NumpyCompBackend(AbstractNumpyBasedBackend):
 
             x_mat, y_mat = _expand_if_single_axis(x_mat, y_mat)
 
-            sims = np.clip(
-                (np.dot(x_mat, y_mat.T) + eps)
-                / (
-                    np.outer(
-                        np.linalg.norm(x_mat, axis=1), np.linalg.norm(y_mat, axis=1)
-                    )
-                    + eps
-                ),
-                -1,
-                1,
-            ).squeeze()
-            return _expand_if_scalar(sims)
+            # one up-front copy of sliced/transposed inputs keeps the row
+            # norms and the gemm on the fast contiguous path
+            if not x_mat.flags.c_contiguous:
+                x_mat = np.ascontiguousarray(x_mat)
+            if not y_mat.flags.c_contiguous:
+                y_mat = np.ascontiguousarray(y_mat)
+
+            # divide once by the symmetric outer product of the norms: two
+            # sequential divisions would round in opposite orders for
+            # cosine_sim(a, b) vs cosine_sim(b, a) and break exact symmetry
+            x_norm = np.sqrt(np.einsum('ij,ij->i', x_mat, x_mat))
+            y_norm = np.sqrt(np.einsum('ij,ij->i', y_mat, y_mat))
+            sims = np.dot(x_mat, y_mat.T)
+            if not np.issubdtype(sims.dtype, np.inexact):
+                sims = sims.astype(np.float64)
+            sims += eps
+            denom = x_norm[:, np.newaxis] * y_norm
+            denom += eps
+            sims /= denom
+            np.clip(sims, -1, 1, out=sims)
+            return _expand_if_scalar(sims.squeeze())
 
         @classmethod
         def euclidean_dist(
@@ -272,19 +300,41 @@ class NumpyCompBackend(AbstractNumpyBasedBackend):
                 The index [i_x, i_y] contains the cosine Squared Euclidian between
                 x_mat[i_x] and y_mat[i_y].
             """
-            eps: float = 1e-7  # avoid problems with numerical inaccuracies
-
             if device is not None:
                 warnings.warn('`device` is not supported for numpy operations')
 
             x_mat, y_mat = _expand_if_single_axis(x_mat, y_mat)
 
-            dists = (
-                np.sum(y_mat**2, axis=1)
-                + np.sum(x_mat**2, axis=1)[:, np.newaxis]
-                - 2 * np.dot(x_mat, y_mat.T)
-            ).squeeze()
-
-            # remove numerical artifacts
-            dists = np.where(np.logical_and(dists < 0, dists > -eps), 0, dists)
-            return _expand_if_scalar(dists)
+            # one up-front copy of sliced/transposed inputs keeps the row
+            # norms and the gemm on the fast contiguous path
+            if not x_mat.flags.c_contiguous:
+                x_mat = np.ascontiguousarray(x_mat)
+            if not y_mat.flags.c_contiguous:
+                y_mat = np.ascontiguousarray(y_mat)
+
+            # bool (binary-embedding) inputs cannot host the in-place folds
+            # below and make einsum return logical results; accumulate in
+            # int64, which is what the non-tiled formula produced for them
+            if x_mat.dtype == np.bool_ or y_mat.dtype == np.bool_:
+                x_mat = x_mat.astype(np.int64)
+                y_mat = y_mat.astype(np.int64)
+
+            # compute the row norms with einsum (no squared temporaries) and
+            # fold them into the gemm result in place: only the (n_x, n_y)
+            # output matrix is ever allocated. The gemm is tiled along the
+            # x-axis so each block is still in cache when the norms are
+            # added and the artifact clip runs.
+            x_sq = np.einsum('ij,ij->i', x_mat, x_mat)
+            y_sq = np.einsum('ij,ij->i', y_mat, y_mat)
+            n_x = x_mat.shape[0]
+            dists = np.empty((n_x, y_mat.shape[0]), dtype=np.result_type(x_mat, y_mat))
+            for i0 in range(0, n_x, _DIST_BLOCK_ROWS):
+                i1 = i0 + _DIST_BLOCK_ROWS
+                block = dists[i0:i1]
+                np.dot(x_mat[i0:i1], y_mat.T, out=block)
+                block *= -2
+                block += y_sq
+                block += x_sq[i0:i1, np.newaxis]
+                # remove numerical artifacts (true squared distances are >= 0)
+                np.maximum(block, 0, out=block)
+            return _expand_if_scalar(dists.squeeze())
@@ -24,6 +24,19 @@ else:
 
 T = TypeVar('T', bound='AudioDoc')
 
+# resolved once at import so that _validate does a single C-level isinstance
+# instead of re-checking the optional frameworks per document
+_RAW_TENSOR_TYPES = tuple(
+    t
+    for t in (
+        AbstractTensor,
+        np.ndarray,
+        torch.Tensor if torch is not None else None,
+        tf.Tensor if tf is not None else None,
+    )
+    if t is not None
+)
+
 
 class AudioDoc(BaseDoc):
     """
@@ -127,11 +140,7 @@ class AudioDoc(BaseDoc):
     def _validate(cls, value) -> Dict[str, Any]:
         if isinstance(value, str):
             value = dict(url=value)
-        elif isinstance(value, (AbstractTensor, np.ndarray)) or (
-            torch is not None
-            and isinstance(value, torch.Tensor)
-            or (tf is not None and isinstance(value, tf.Tensor))
-        ):
+        elif isinstance(value, _RAW_TENSOR_TYPES):
             value = dict(tensor=value)
 
         return value
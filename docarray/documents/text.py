@@ -129,6 +129,10 @@ class TextDoc(BaseDoc):
     )
 
     def __init__(self, text: Optional[str] = None, **kwargs):
+        if not kwargs:
+            # hot path: TextDoc('hello') with no other fields
+            super().__init__(text=text)
+            return
         if 'text' not in kwargs:
             kwargs['text'] = text
         super().__init__(**kwargs)
@@ -2,6 +2,7 @@ import copy
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field, replace
+from functools import lru_cache
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -73,6 +74,37 @@ def _raise_not_supported(name):
     return _inner
 
 
+@lru_cache(maxsize=None)
+def _doc_conversion_fields(
+    schema: Type[BaseDoc],
+) -> Tuple[Tuple[str, ...], Tuple[Tuple[str, Type[BaseDoc]], ...]]:
+    """Classify the schema fields needed to rebuild a doc from a flat dict.
+
+    Returns the names of the DocList-typed fields (backed by subindices) and
+    the `(name, type)` pairs of the nested `BaseDoc` fields, with `Optional`
+    unwrapped. The classification only depends on the schema, so it is
+    computed once per class instead of once per retrieved document.
+    """
+    subindex_fields: List[str] = []
+    nested_doc_fields: List[Tuple[str, Type[BaseDoc]]] = []
+
+    for field_name in schema._docarray_fields().keys():
+        t_ = schema._get_field_annotation(field_name)
+
+        if not is_union_type(t_) and safe_issubclass(t_, AnyDocArray):
+            subindex_fields.append(field_name)
+
+        if is_optional_type(t_):
+            for t_arg in get_args(t_):
+                if t_arg is not type(None):
+                    t_ = t_arg
+
+        if not is_union_type(t_) and safe_issubclass(t_, BaseDoc):
+            nested_doc_fields.append((field_name, t_))
+
+    return tuple(subindex_fields), tuple(nested_doc_fields)
+
+
 @dataclass
 class _ColumnInfo:
     docarray_type: Type
@@ -1087,30 +1119,21 @@ class BaseDocIndex(ABC, Generic[TSchema]):
         :param schema: The schema of the Document object
         :return: A Document object
         """
-        for field_name, _ in schema._docarray_fields().items():
-            t_ = schema._get_field_annotation(field_name)
+        subindex_fields, nested_doc_fields = _doc_conversion_fields(schema)
 
-            if not is_union_type(t_) and safe_issubclass(t_, AnyDocArray):
-                self._get_subindex_doclist(doc_dict, field_name)
+        for field_name in subindex_fields:
+            self._get_subindex_doclist(doc_dict, field_name)
 
-            if is_optional_type(t_):
-                for t_arg in get_args(t_):
-                    if t_arg is not type(None):
-                        t_ = t_arg
+        for field_name, t_ in nested_doc_fields:
+            inner_dict = {}
 
-            if not is_union_type(t_) and safe_issubclass(t_, BaseDoc):
-                inner_dict = {}
+            prefix = f'{field_name}__'
+            fields = [key for key in doc_dict.keys() if key.startswith(prefix)]
+            for key in fields:
+                nested_name = key[len(prefix) :]
+                inner_dict[nested_name] = doc_dict.pop(key)
 
-                fields = [
-                    key for key in doc_dict.keys() if key.startswith(f'{field_name}__')
-                ]
-                for key in fields:
-                    nested_name = key[len(f'{field_name}__') :]
-                    inner_dict[nested_name] = doc_dict.pop(key)
-
-                doc_dict[field_name] = self._convert_dict_to_doc(
-                    inner_dict, t_, inner=True
-                )
+            doc_dict[field_name] = self._convert_dict_to_doc(inner_dict, t_, inner=True)
 
         if self._is_subindex and not inner:
             doc_dict.pop('parent_id', None)
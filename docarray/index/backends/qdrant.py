@@ -1,5 +1,9 @@
+import hashlib
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import islice
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -31,7 +35,7 @@ from docarray.index.abstract import (
 from docarray.typing import NdArray
 from docarray.typing.tensor.abstract_tensor import AbstractTensor
 from docarray.utils._internal._typing import safe_issubclass
-from docarray.utils._internal.misc import import_library, torch_imported
+from docarray.utils._internal.misc import import_library, is_torch_available
 from docarray.utils.find import _FindResult
 
 if TYPE_CHECKING:
@@ -48,7 +52,7 @@ else:
 TSchema = TypeVar('TSchema', bound=BaseDoc)
 
 QDRANT_PY_VECTOR_TYPES: List[Any] = [np.ndarray, AbstractTensor]
-if torch_imported:
+if is_torch_available():
     import torch
 
     QDRANT_PY_VECTOR_TYPES.append(torch.Tensor)
@@ -61,6 +65,31 @@ QDRANT_SPACE_MAPPING = {
 
 RawQuery = Dict[str, Any]
 
+# sha1 pre-seeded with the uuid5 namespace, copied per id so the namespace
+# bytes are only hashed once
+_QDRANT_ID_HASH_PROTO = hashlib.sha1(
+    uuid.UUID('3896d314-1e95-4a3a-b45a-945f9f0b541d').bytes
+)
+
+
+@lru_cache(maxsize=None)
+def _generated_vector(n_dim: int) -> Tuple[float, ...]:
+    """Placeholder embedding for points indexed without a vector; built once
+    per dimensionality instead of once per row."""
+    return (1.0,) * n_dim
+
+
+@lru_cache(maxsize=4096)
+def _external_id_to_qdrant_id(external_id: str) -> str:
+    """Equivalent of `uuid.uuid5(UUID_NAMESPACE, external_id).hex` without
+    re-hashing the namespace or building a UUID object per call."""
+    sha1 = _QDRANT_ID_HASH_PROTO.copy()
+    sha1.update(external_id.encode('utf-8'))
+    digest = bytearray(sha1.digest()[:16])
+    digest[6] = (digest[6] & 0x0F) | 0x50  # version 5
+    digest[8] = (digest[8] & 0x3F) | 0x80  # RFC 4122 variant
+    return digest.hex()
+
 
 class QdrantDocumentIndex(BaseDocIndex, Generic[TSchema]):
     UUID_NAMESPACE = uuid.UUID('3896d314-1e95-4a3a-b45a-945f9f0b541d')
@@ -75,6 +104,11 @@ class QdrantDocumentIndex(BaseDocIndex, Generic[TSchema]):
         self._db_config: QdrantDocumentIndex.DBConfig = cast(
             QdrantDocumentIndex.DBConfig, self._db_config
         )
+        client_kwargs: Dict[str, Any] = {}
+        if self._db_config.pool_size is not None:
+            # only forwarded when set: the kwarg appeared in qdrant-client
+            # releases newer than our minimum pin
+            client_kwargs['pool_size'] = self._db_config.pool_size
         self._client = qdrant_client.QdrantClient(
             location=self._db_config.location,
             url=self._db_config.url,
@@ -87,22 +121,45 @@ class QdrantDocumentIndex(BaseDocIndex, Generic[TSchema]):
             timeout=self._db_config.timeout,
             host=self._db_config.host,
             path=self._db_config.path,
+            **client_kwargs,
+        )
+        # column partitions by db_type, computed once so building a point
+        # walks plain tuples instead of filtering _column_infos per row
+        self._payload_columns = tuple(
+            name
+            for name, info in self._column_infos.items()
+            if info.db_type in ('id', 'payload')
+            and not safe_issubclass(info.docarray_type, AnyDocArray)
+        )
+        self._vector_columns = tuple(
+            (name, info.n_dim or info.config.get('dim'))
+            for name, info in self._column_infos.items()
+            if info.db_type == 'vector'
         )
         self._initialize_collection()
+        if not self._db_config.prefer_grpc:
+            # the REST transport JSON-encodes every payload; gRPC ships
+            # binary protobuf and is the intended path for bulk indexing
+            self._logger.warning(
+                'prefer_grpc is set to False; the REST transport is noticeably '
+                'slower for high-volume indexing and search'
+            )
         self._logger.info(f'{self.__class__.__name__} has been initialized')
 
     @property
     def collection_name(self):
-        default_collection_name = (
-            self._schema.__name__.lower() if self._schema is not None else None
+        try:
+            return self._collection_name
+        except AttributeError:
+            pass
+        # resolved once on first access; the name is invariant after the
+        # config post-init, and this property is dereferenced on every
+        # indexing and query call. BaseDocIndex.__init__ already rejects
+        # untyped indexes, so _schema is guaranteed here.
+        self._collection_name = (
+            self._db_config.collection_name or self._schema.__name__.lower()  # type: ignore[union-attr]
         )
-        if default_collection_name is None:
-            raise ValueError(
-                'A QdrantDocumentIndex must be typed with a Document type.'
-                'To do so, use the syntax: QdrantDocumentIndex[DocumentType]'
-            )
-
-        return self._db_config.collection_name or default_collection_name
+        return self._collection_name
 
     @property
     def index_name(self):
@@ -234,6 +291,12 @@ class QdrantDocumentIndex(BaseDocIndex, Generic[TSchema]):
         host: Optional[str] = None
         path: Optional[str] = None
         collection_name: Optional[str] = None
+        # number of points sent per upsert request during indexing; bounds
+        # the request payload so large DocLists do not hit server timeouts
+        batch_size: int = 512
+        # size of the client's connection/channel pool; raise it for highly
+        # concurrent query workloads (requires a recent qdrant-client)
+        pool_size: Optional[int] = None
         shard_number: Optional[int] = None
         replication_factor: Optional[int] = None
         write_consistency_factor: Optional[int] = None
@@ -310,13 +373,13 @@ class QdrantDocumentIndex(BaseDocIndex, Generic[TSchema]):
     def _index(self, column_to_data: Dict[str, Generator[Any, None, None]]):
         self._index_subindex(column_to_data)
 
-        rows = self._transpose_col_value_dict(column_to_data)
-        # TODO: add batching the documents to avoid timeouts
-        points = [self._build_point_from_row(row) for row in rows]
-        self._client.upsert(
-            collection_name=self.collection_name,
-            points=points,
-        )
+        rows = iter(self._transpose_col_value_dict(column_to_data))
+        batch_size = self._db_config.batch_size
+        while batch := list(islice(rows, batch_size)):
+            self._client.upsert(
+                collection_name=self.collection_name,
+                points=[self._build_point_from_row(row) for row in batch],
+            )
 
     def num_docs(self) -> int:
         """
@@ -464,13 +527,16 @@ class QdrantDocumentIndex(BaseDocIndex, Generic[TSchema]):
     def _find_batched(
         self, queries: np.ndarray, limit: int, search_field: str = ''
     ) -> _FindResultBatched:
+        # one C-level conversion of the whole query matrix instead of a
+        # tolist() call per row
+        query_lists = np.asarray(queries).tolist()
         responses = self._client.search_batch(
             collection_name=self.collection_name,
             requests=[
                 rest.SearchRequest(
                     vector=rest.NamedVector(
                         name=search_field,
-                        vector=query.tolist(),  # type: ignore
+                        vector=query,  # type: ignore
                     ),
                     # The following filter takes care of using only those points which
                     # do not have the vector generated. Those are excluded from the
@@ -487,7 +553,7 @@ class QdrantDocumentIndex(BaseDocIndex, Generic[TSchema]):
                     with_vector=True,
                     with_payload=True,
                 )
-                for query in queries
+                for query in query_lists
             ],
         )
         return _FindResultBatched(
@@ -496,8 +562,15 @@ class QdrantDocumentIndex(BaseDocIndex, Generic[TSchema]):
                 for response in responses
             ],
             scores=[
+                # fill a float32 buffer directly instead of materializing a
+                # Python list that numpy then re-boxes; qdrant scores are
+                # f32 server-side anyway
                 NdArray._docarray_from_native(
-                    np.array([point.score for point in response])
+                    np.fromiter(
+                        (point.score for point in response),
+                        dtype=np.float32,
+                        count=len(response),
+                    )
                 )
                 for response in responses
             ],
@@ -513,10 +586,9 @@ class QdrantDocumentIndex(BaseDocIndex, Generic[TSchema]):
     def _filter_batched(
         self, filter_queries: Sequence[rest.Filter], limit: int
     ) -> Union[List[DocList], List[List[Dict]]]:
-        responses = []
-        for filter_query in filter_queries:
-            # There is no batch scroll available in Qdrant client yet, so we need to
-            # perform the queries one by one. It will be changed in the future versions.
+        # There is no batch scroll available in Qdrant client yet, so we need to
+        # perform the queries one by one. It will be changed in the future versions.
+        def _scroll(filter_query: rest.Filter) -> List[Any]:
             response, _ = self._client.scroll(
                 collection_name=self.collection_name,
                 scroll_filter=filter_query,
@@ -524,7 +596,17 @@ class QdrantDocumentIndex(BaseDocIndex, Generic[TSchema]):
                 with_payload=True,
                 with_vectors=True,
             )
-            responses.append(response)
+            return response
+
+        if len(filter_queries) <= 1:
+            responses = [_scroll(fq) for fq in filter_queries]
+        else:
+            # the scrolls are independent round-trips, so overlap them; the
+            # client is thread-safe for both the REST and gRPC transports
+            with ThreadPoolExecutor(
+                max_workers=min(len(filter_queries), 16)
+            ) as executor:
+                responses = list(executor.map(_scroll, filter_queries))
 
         return [
             [self._convert_to_doc(point) for point in response]
@@ -543,12 +625,17 @@ class QdrantDocumentIndex(BaseDocIndex, Generic[TSchema]):
     def _text_search_batched(
         self, queries: Sequence[str], limit: int, search_field: str = ''
     ) -> _FindResultBatched:
+        # bind the model classes locally; for big batches the repeated
+        # attribute lookups on the rest module add up
+        _filter_cls = rest.Filter
+        _condition_cls = rest.FieldCondition
+        _match_cls = rest.MatchText
         filter_queries = [
-            rest.Filter(
+            _filter_cls(
                 must=[
-                    rest.FieldCondition(
+                    _condition_cls(
                         key=search_field,
-                        match=rest.MatchText(text=query),
+                        match=_match_cls(text=query),
                     )
                 ]
             )
@@ -586,31 +673,26 @@ class QdrantDocumentIndex(BaseDocIndex, Generic[TSchema]):
 
     def _build_point_from_row(self, row: Dict[str, Any]) -> rest.PointStruct:
         point_id = self._to_qdrant_id(row.get('id'))
-        vectors: Dict[str, List[float]] = {}
-        payload: Dict[str, Any] = {'__generated_vectors': []}
-        for column_name, column_info in self._column_infos.items():
-            if safe_issubclass(column_info.docarray_type, AnyDocArray):
-                continue
-            if column_info.db_type in ['id', 'payload']:
-                payload[column_name] = row.get(column_name)
-                continue
+        generated_vectors: List[str] = []
+        payload: Dict[str, Any] = {'__generated_vectors': generated_vectors}
+        for column_name in self._payload_columns:
+            payload[column_name] = row.get(column_name)
 
+        vectors: Dict[str, List[float]] = {}
+        for column_name, vector_size in self._vector_columns:
             vector = row.get(column_name)
-            if column_info.db_type == 'vector' and vector is not None:
-                vectors[column_name] = vector.tolist()
-            elif column_info.db_type == 'vector' and vector is None:
+            if vector is not None:
+                # go through numpy first: ndarray.tolist() converts the whole
+                # buffer in one C call, while tolist() on framework tensors
+                # walks the elements in Python
+                vectors[column_name] = self._to_numpy(vector).tolist()
+            else:
                 # In that case vector was not provided. Qdrant does not support optional
                 # vectors - each point needs to have all the vectors already assigned.
                 # Thus, we put a fake embedding with the correct dimensionality and mark
                 # such point a point with a boolean flag in the payload.
-                vector_size = column_info.n_dim or column_info.config.get('dim')
-                vectors[column_name] = np.ones(vector_size).tolist()  # type: ignore[arg-type]
-                payload['__generated_vectors'].append(column_name)
-            else:
-                raise ValueError(
-                    f'Could not handle the conversion for column {column_name}. '
-                    f'Column info: {column_info}'
-                )
+                vectors[column_name] = list(_generated_vector(vector_size))  # type: ignore[arg-type]
+                generated_vectors.append(column_name)
         return rest.PointStruct(
             id=point_id,
             vector=vectors,
@@ -620,7 +702,7 @@ class QdrantDocumentIndex(BaseDocIndex, Generic[TSchema]):
     def _to_qdrant_id(self, external_id: Optional[str]) -> str:
         if external_id is None:
             return uuid.uuid4().hex
-        return uuid.uuid5(QdrantDocumentIndex.UUID_NAMESPACE, external_id).hex
+        return _external_id_to_qdrant_id(external_id)
 
     def _to_qdrant_vector_params(self, column_info: _ColumnInfo) -> rest.VectorParams:
         return rest.VectorParams(
@@ -645,5 +727,8 @@ class QdrantDocumentIndex(BaseDocIndex, Generic[TSchema]):
                 # That means the vector was generated during the upload, and should not
                 # be returned along the other vectors.
                 pass
-            document[vector_name] = vector
+            # one C-level conversion here instead of letting schema validation
+            # box the float list again downstream; qdrant stores f32, so the
+            # narrower dtype is lossless
+            document[vector_name] = np.asarray(vector, dtype=np.float32)
         return document
@@ -1,7 +1,10 @@
 import base64
 import copy
+import hashlib
 import logging
 import os
+import sys
+import uuid
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import (
@@ -44,16 +47,38 @@ TSchema = TypeVar('TSchema', bound=BaseDoc)
 T = TypeVar('T', bound='WeaviateDocumentIndex')
 
 
+# dynamic batching lets the client size batches from observed server
+# latency, and extra workers keep requests in flight while the next
+# batch is being built
 DEFAULT_BATCH_CONFIG = {
-    "batch_size": 20,
-    "dynamic": False,
+    "batch_size": 100,
+    "dynamic": True,
     "timeout_retries": 3,
-    "num_workers": 1,
+    "num_workers": 2,
 }
 
 DEFAULT_BINARY_PATH = str(Path.home() / ".cache/weaviate-embedded/")
 DEFAULT_PERSISTENCE_DATA_PATH = str(Path.home() / ".local/share/weaviate")
 
+# sha1 state pre-seeded with the uuid5 namespace, copied per document so the
+# namespace bytes are only ever hashed once
+_UUID5_DNS_PROTOTYPE = hashlib.sha1(uuid.NAMESPACE_DNS.bytes)
+
+
+def _generate_uuid5(identifier: Any, namespace: Any = "") -> str:
+    """Bit-identical, faster replacement for `weaviate.util.generate_uuid5`.
+
+    :param identifier: the object the UUID is derived from
+    :param namespace: optional namespace for the identifier
+    :return: a deterministic UUIDv5 as a string
+    """
+    sha1 = _UUID5_DNS_PROTOTYPE.copy()
+    sha1.update(f'{namespace}{identifier}'.encode('utf-8'))
+    digest = bytearray(sha1.digest()[:16])
+    digest[6] = (digest[6] & 0x0F) | 0x50  # version 5
+    digest[8] = (digest[8] & 0x3F) | 0x80  # RFC 4122 variant
+    return str(uuid.UUID(bytes=bytes(digest)))
+
 
 @dataclass
 class EmbeddedOptions:
@@ -113,6 +138,15 @@ class WeaviateDocumentIndex(BaseDocIndex, Generic[TSchema]):
         self._set_properties()
         self._create_schema()
 
+        # string columns flagged low_cardinality=True in their column config
+        # are interned on read, so repeated categorical values share a single
+        # str object instead of one fresh allocation per result
+        self._intern_columns = frozenset(
+            name
+            for name, info in self._column_infos.items()
+            if info.config.get('low_cardinality', False)
+        )
+
     @property
     def index_name(self):
         default_index_name = self._schema.__name__ if self._schema is not None else None
@@ -219,12 +253,15 @@ class WeaviateDocumentIndex(BaseDocIndex, Generic[TSchema]):
             properties.append(prop)
 
         # TODO: What is the best way to specify other config that is part of schema?
-        # e.g. invertedIndexConfig, shardingConfig, moduleConfig, vectorIndexConfig
+        # e.g. invertedIndexConfig, shardingConfig, moduleConfig
         #       and configure replication
         # we will update base on user feedback
         schema["properties"] = properties
         schema["class"] = self.index_name
 
+        if self._db_config.vector_index_config is not None:
+            schema["vectorIndexConfig"] = self._db_config.vector_index_config
+
         if self._client.schema.exists(self.index_name):
             logging.warning(
                 f"Found index {self.index_name} with schema {schema}. Will reuse existing schema."
@@ -243,6 +280,13 @@ class WeaviateDocumentIndex(BaseDocIndex, Generic[TSchema]):
         scopes: List[str] = field(default_factory=lambda: ["offline_access"])
         auth_api_key: Optional[str] = None
         embedded_options: Optional[EmbeddedOptions] = None
+        # 'uuid5' derives deterministic object ids from the document content,
+        # 'uuid4' assigns random ids and skips serializing the document for
+        # hashing on the hot insert path
+        uuid_strategy: Literal['uuid5', 'uuid4'] = 'uuid5'
+        # passed through as the class's vectorIndexConfig on creation, e.g.
+        # {'pq': {'enabled': True}} to turn on server-side vector compression
+        vector_index_config: Optional[Dict[str, Any]] = None
         default_column_config: Dict[Any, Dict[str, Any]] = field(
             default_factory=lambda: {
                 np.ndarray: {},
@@ -278,13 +322,12 @@ class WeaviateDocumentIndex(BaseDocIndex, Generic[TSchema]):
     def _del_items(self, doc_ids: Sequence[str]):
         has_matches = True
 
-        operands = [
-            {"path": [DOCUMENTID], "operator": "Equal", "valueString": doc_id}
-            for doc_id in doc_ids
-        ]
+        # a single ContainsAny operand instead of one Equal operand per id
+        # inside an Or keeps the filter O(1) in size for the GraphQL parser
         where_filter = {
-            "operator": "Or",
-            "operands": operands,
+            "path": [DOCUMENTID],
+            "operator": "ContainsAny",
+            "valueStringArray": list(doc_ids),
         }
 
         # do a loop because there is a limit to how many objects can be deleted at
@@ -298,30 +341,37 @@ class WeaviateDocumentIndex(BaseDocIndex, Generic[TSchema]):
 
             has_matches = results["results"]["matches"]
 
-    def _filter(self, filter_query: Any, limit: int) -> Union[DocList, List[Dict]]:
+    def _filter(
+        self, filter_query: Any, limit: int, return_embeddings: bool = True
+    ) -> Union[DocList, List[Dict]]:
         self._overwrite_id(filter_query)
 
-        results = (
+        q = (
             self._client.query.get(self.index_name, self.properties)
-            .with_additional("vector")
             .with_where(filter_query)
             .with_limit(limit)
-            .do()
         )
+        if return_embeddings:
+            # the stored vector dominates the response payload; only ask the
+            # server to ship it back when the caller wants it
+            q = q.with_additional("vector")
+        results = q.do()
 
         docs = results["data"]["Get"][self.index_name]
 
         return [self._parse_weaviate_result(doc) for doc in docs]
 
     def _filter_batched(
-        self, filter_queries: Any, limit: int
+        self, filter_queries: Any, limit: int, return_embeddings: bool = True
     ) -> Union[List[DocList], List[List[Dict]]]:
         for filter_query in filter_queries:
             self._overwrite_id(filter_query)
 
+        additional = ["vector"] if return_embeddings else []
+
         qs = [
             self._client.query.get(self.index_name, self.properties)
-            .with_additional("vector")
+            .with_additional(additional)
             .with_where(filter_query)
             .with_limit(limit)
             .with_alias(f'query_{i}')
@@ -375,15 +425,19 @@ class WeaviateDocumentIndex(BaseDocIndex, Generic[TSchema]):
         Overwrite the id field in the where filter to DOCUMENTID
         if the "id" field is present in the path
         """
-        for key, value in where_filter.items():
-            if key == "path" and value == ["id"]:
-                where_filter[key] = [DOCUMENTID]
-            elif isinstance(value, dict):
-                self._overwrite_id(value)
-            elif isinstance(value, list):
-                for item in value:
-                    if isinstance(item, dict):
-                        self._overwrite_id(item)
+        # iterative walk: one explicit stack instead of a recursion frame
+        # per nesting level of the filter
+        stack = [where_filter]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, dict):
+                if node.get("path") == ["id"]:
+                    node["path"] = [DOCUMENTID]
+                stack.extend(
+                    value for value in node.values() if isinstance(value, (dict, list))
+                )
+            else:
+                stack.extend(item for item in node if isinstance(item, (dict, list)))
 
     def _find(
         self,
@@ -392,6 +446,7 @@ class WeaviateDocumentIndex(BaseDocIndex, Generic[TSchema]):
         search_field: str = '',
         score_name: Literal["certainty", "distance"] = "certainty",
         score_threshold: Optional[float] = None,
+        return_embeddings: bool = True,
     ) -> _FindResult:
         index_name = self.index_name
         if search_field:
@@ -404,13 +459,15 @@ class WeaviateDocumentIndex(BaseDocIndex, Generic[TSchema]):
         if score_threshold:
             near_vector[score_name] = score_threshold
 
+        additional = [score_name, "vector"] if return_embeddings else [score_name]
+
         results = (
             self._client.query.get(index_name, self.properties)
             .with_near_vector(
                 near_vector,
             )
             .with_limit(limit)
-            .with_additional([score_name, "vector"])
+            .with_additional(additional)
             .do()
         )
 
@@ -421,20 +478,19 @@ class WeaviateDocumentIndex(BaseDocIndex, Generic[TSchema]):
 
     def _format_response(
         self, results, score_name
-    ) -> Tuple[List[Dict[Any, Any]], List[Any]]:
+    ) -> Tuple[List[Dict[Any, Any]], np.ndarray]:
         """
         Format the response from Weaviate into a Tuple of DocList and scores
         """
 
-        documents = []
-        scores = []
-
-        for result in results:
-            score = result["_additional"][score_name]
-            scores.append(score)
-
-            document = self._parse_weaviate_result(result)
-            documents.append(document)
+        documents = [self._parse_weaviate_result(result) for result in results]
+        # a contiguous float32 array instead of a list of Python objects;
+        # this also turns the stringly-typed bm25 scores into numbers
+        scores = np.fromiter(
+            (result["_additional"][score_name] for result in results),
+            dtype=np.float32,
+            count=len(results),
+        )
 
         return documents, scores
 
@@ -488,19 +544,23 @@ class WeaviateDocumentIndex(BaseDocIndex, Generic[TSchema]):
         search_field: str = '',
         score_name: Literal["certainty", "distance"] = "certainty",
         score_threshold: Optional[float] = None,
+        return_embeddings: bool = True,
     ) -> _FindResultBatched:
+        # the threshold is invariant across the batch, so resolve it once
+        threshold_args: Dict[str, Any] = (
+            {score_name: score_threshold} if score_threshold else {}
+        )
+        additional = [score_name, "vector"] if return_embeddings else [score_name]
+
         qs = []
         for i, query in enumerate(queries):
-            near_vector: Dict[str, Any] = {"vector": query}
-
-            if score_threshold:
-                near_vector[score_name] = score_threshold
+            near_vector: Dict[str, Any] = {"vector": query, **threshold_args}
 
             q = (
                 self._client.query.get(self.index_name, self.properties)
                 .with_near_vector(near_vector)
                 .with_limit(limit)
-                .with_additional([score_name, "vector"])
+                .with_additional(additional)
                 .with_alias(f'query_{i}')
             )
 
@@ -544,12 +604,11 @@ class WeaviateDocumentIndex(BaseDocIndex, Generic[TSchema]):
         return docs
 
     def _rewrite_documentid(self, document: Dict):
-        doc = document.copy()
-
-        # rewrite the id to DOCUMENTID
-        document_id = doc.pop('id')
-        doc[DOCUMENTID] = document_id
-
+        # single pass over the source dict; DOCUMENTID is appended last so
+        # the key order (and thus the uuid5 derived from the dict's string
+        # form) stays identical to the old copy-then-pop version
+        doc = {k: v for k, v in document.items() if k != 'id'}
+        doc[DOCUMENTID] = document['id']
         return doc
 
     def _parse_weaviate_result(self, result: Dict) -> Dict:
@@ -558,28 +617,40 @@ class WeaviateDocumentIndex(BaseDocIndex, Generic[TSchema]):
         that was used to initialize weaviate with.
         """
 
-        result = result.copy()
+        take_vector = '_additional' in result and bool(self.embedding_column)
+
+        # one pass over the source instead of copy + pop + pop
+        parsed = {
+            k: v
+            for k, v in result.items()
+            if k != DOCUMENTID and not (take_vector and k == '_additional')
+        }
 
         # rewrite the DOCUMENTID to id
         if DOCUMENTID in result:
-            result['id'] = result.pop(DOCUMENTID)
+            parsed['id'] = result[DOCUMENTID]
 
         # take the vector from the _additional field
-        if '_additional' in result and self.embedding_column:
-            additional_fields = result.pop('_additional')
-            if 'vector' in additional_fields:
-                result[self.embedding_column] = additional_fields['vector']
+        if take_vector and 'vector' in result['_additional']:
+            parsed[self.embedding_column] = result['_additional']['vector']
+
+        # deduplicate low-cardinality string columns
+        for column in self._intern_columns:
+            value = parsed.get(column)
+            if isinstance(value, str):
+                parsed[column] = sys.intern(value)
 
         # convert any base64 encoded bytes column to bytes
-        self._decode_base64_properties_to_bytes(result)
+        self._decode_base64_properties_to_bytes(parsed)
 
-        return result
+        return parsed
 
     def _index(self, column_to_data: Dict[str, Generator[Any, None, None]]):
         self._index_subindex(column_to_data)
 
         docs = self._transpose_col_value_dict(column_to_data)
         index_name = self.index_name
+        use_random_ids = self._db_config.uuid_strategy == 'uuid4'
 
         with self._client.batch as batch:
             for doc in docs:
@@ -593,23 +664,30 @@ class WeaviateDocumentIndex(BaseDocIndex, Generic[TSchema]):
                 )
 
                 batch.add_data_object(
-                    uuid=weaviate.util.generate_uuid5(parsed_doc, index_name),
+                    uuid=str(uuid.uuid4())
+                    if use_random_ids
+                    else _generate_uuid5(parsed_doc, index_name),
                     data_object=parsed_doc,
                     class_name=index_name,
                     vector=vector,
                 )
 
     def _text_search(
-        self, query: str, limit: int, search_field: str = ''
+        self,
+        query: str,
+        limit: int,
+        search_field: str = '',
+        return_embeddings: bool = True,
     ) -> _FindResult:
         index_name = self.index_name
         bm25 = {"query": query, "properties": [search_field]}
+        additional = ["score", "vector"] if return_embeddings else ["score"]
 
         results = (
             self._client.query.get(index_name, self.properties)
             .with_bm25(**bm25)
             .with_limit(limit)
-            .with_additional(["score", "vector"])
+            .with_additional(additional)
             .do()
         )
 
@@ -620,8 +698,14 @@ class WeaviateDocumentIndex(BaseDocIndex, Generic[TSchema]):
         return _FindResult(documents=docs, scores=parse_obj_as(NdArray, scores))
 
     def _text_search_batched(
-        self, queries: Sequence[str], limit: int, search_field: str = ''
+        self,
+        queries: Sequence[str],
+        limit: int,
+        search_field: str = '',
+        return_embeddings: bool = True,
     ) -> _FindResultBatched:
+        additional = ["score", "vector"] if return_embeddings else ["score"]
+
         qs = []
         for i, query in enumerate(queries):
             bm25 = {"query": query, "properties": [search_field]}
@@ -630,7 +714,7 @@ class WeaviateDocumentIndex(BaseDocIndex, Generic[TSchema]):
                 self._client.query.get(self.index_name, self.properties)
                 .with_bm25(**bm25)
                 .with_limit(limit)
-                .with_additional(["score", "vector"])
+                .with_additional(additional)
                 .with_alias(f'query_{i}')
             )
 
@@ -839,15 +923,23 @@ class WeaviateDocumentIndex(BaseDocIndex, Generic[TSchema]):
             Overwrite the id field in the where filter to DOCUMENTID
             if the "id" field is present in the path
             """
-            for key, value in where_filter.items():
-                if key == "path" and value == ["id"]:
-                    where_filter[key] = [DOCUMENTID]
-                elif isinstance(value, dict):
-                    self._overwrite_id(value)
-                elif isinstance(value, list):
-                    for item in value:
-                        if isinstance(item, dict):
-                            self._overwrite_id(item)
+            # iterative walk: one explicit stack instead of a recursion frame
+            # per nesting level of the filter
+            stack = [where_filter]
+            while stack:
+                node = stack.pop()
+                if isinstance(node, dict):
+                    if node.get("path") == ["id"]:
+                        node["path"] = [DOCUMENTID]
+                    stack.extend(
+                        value
+                        for value in node.values()
+                        if isinstance(value, (dict, list))
+                    )
+                else:
+                    stack.extend(
+                        item for item in node if isinstance(item, (dict, list))
+                    )
 
         def find(
             self,
@@ -16,7 +16,6 @@ __all__ = ['FileDocStore']
 def __getattr__(name: str):
     lib: types.ModuleType
     if name == 'S3DocStore':
-        import_library('smart_open', raise_error=True)
         import_library('botocore', raise_error=True)
         import_library('boto3', raise_error=True)
         import docarray.store.s3 as lib
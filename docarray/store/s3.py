@@ -1,5 +1,9 @@
+import gzip
 import io
 import logging
+import mmap
+import os
+import zlib
 from pathlib import Path
 from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Type, TypeVar
 
@@ -11,16 +15,18 @@ from docarray.utils._internal.misc import import_library
 if TYPE_CHECKING:  # pragma: no cover
     import boto3
     import botocore
-    from smart_open import open
 
     from docarray import BaseDoc, DocList
 else:
-    open = import_library('smart_open', raise_error=True).open
     boto3 = import_library('boto3', raise_error=True)
     botocore = import_library('botocore', raise_error=True)
 
+zstandard = import_library('zstandard', raise_error=False)
+
 SelfS3DocStore = TypeVar('SelfS3DocStore', bound='S3DocStore')
 
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
 
 class _BufferedCachingReader:
     """A buffered reader that writes to a cache file while reading."""
@@ -47,6 +53,70 @@ class _BufferedCachingReader:
             self._cache.close()
 
 
+class _CompressedStreamReader(io.RawIOBase):
+    """A file-like reader that compresses a stream of byte chunks on the fly.
+
+    Compresses with multi-threaded zstandard when it is installed, otherwise
+    with gzip at compresslevel=1, which is several times faster than the
+    default level at a near-identical ratio for pickle streams."""
+
+    def __init__(self, iter_bytes: Iterator[bytes]):
+        self._iter = iter_bytes
+        self._buffer = bytearray()
+        if zstandard is not None:
+            self._compressor = zstandard.ZstdCompressor(
+                level=3, threads=-1
+            ).compressobj()
+        else:
+            # zlib with a gzip container, equivalent to GzipFile output
+            self._compressor = zlib.compressobj(1, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        self._eof = False
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        while not self._eof and (size < 0 or len(self._buffer) < size):
+            try:
+                chunk = next(self._iter)
+            except StopIteration:
+                self._buffer += self._compressor.flush()
+                self._eof = True
+            else:
+                self._buffer += self._compressor.compress(chunk)
+        if size < 0 or size >= len(self._buffer):
+            data = bytes(self._buffer)
+            self._buffer.clear()
+        else:
+            data = bytes(self._buffer[:size])
+            del self._buffer[:size]
+        return data
+
+
+class _ChainedReader:
+    """A reader that returns `head` before delegating to the `tail` stream."""
+
+    def __init__(self, head: bytes, tail):
+        self._head = head
+        self._tail = tail
+
+    def read(self, size: int = -1) -> bytes:
+        if not self._head:
+            return self._tail.read(size)
+        if size < 0 or size >= len(self._head):
+            data, self._head = self._head, b''
+            remaining = -1 if size < 0 else size - len(data)
+            if remaining:
+                data += self._tail.read(remaining)
+            return data
+        data = self._head[:size]
+        self._head = self._head[size:]
+        return data
+
+    def close(self):
+        self._tail.close()
+
+
 class S3DocStore(AbstractDocStore):
     """Class to push and pull [`DocList`][docarray.DocList] to and from S3."""
 
@@ -61,10 +131,12 @@ class S3DocStore(AbstractDocStore):
         bucket, namespace = namespace.split('/', 1)
         s3 = boto3.resource('s3')
         s3_bucket = s3.Bucket(bucket)
+        # server-side prefix filter: only matching keys are paginated over,
+        # instead of listing every object in the bucket
         da_files = [
             obj
-            for obj in s3_bucket.objects.all()
-            if obj.key.startswith(namespace) and obj.key.endswith('.docs')
+            for obj in s3_bucket.objects.filter(Prefix=namespace)
+            if obj.key.endswith('.docs')
         ]
         da_names = [f.key.split('/')[-1].split('.')[0] for f in da_files]
 
@@ -143,23 +215,22 @@ class S3DocStore(AbstractDocStore):
         :param name: The bucket and key to push to. e.g. my_bucket/my_key
         :param show_progress: If true, a progress bar will be displayed.
         """
+        from boto3.s3.transfer import TransferConfig
+
         bucket, name = name.split('/', 1)
         binary_stream = _to_binary_stream(
             docs, protocol='pickle', compress=None, show_progress=show_progress
         )
 
-        # Upload to S3
-        with open(
-            f"s3://{bucket}/{name}.docs",
-            'wb',
-            compression='.gz',
-            transport_params={'multipart_upload': False},
-        ) as fout:
-            while True:
-                try:
-                    fout.write(next(binary_stream))
-                except StopIteration:
-                    break
+        # Upload to S3 with concurrent multipart instead of a sequential
+        # single-part stream; parts are read off the compressed stream as
+        # they are produced
+        boto3.client('s3').upload_fileobj(
+            _CompressedStreamReader(binary_stream),
+            bucket,
+            f'{name}.docs',
+            Config=TransferConfig(multipart_threshold=8 * 2**20, max_concurrency=8),
+        )
 
         return {}
 
@@ -207,8 +278,22 @@ class S3DocStore(AbstractDocStore):
         save_name = name.replace('/', '_')
         cache_path = _get_cache_path() / f'{save_name}.docs'
 
+        body = boto3.client('s3').get_object(Bucket=bucket, Key=f'{name}.docs')['Body']
+        # sniff the magic bytes: objects may be zstd (current) or gzip
+        # (fallback and older pushes)
+        magic = body.read(4)
+        raw = _ChainedReader(magic, body)
+        if magic.startswith(ZSTD_MAGIC):
+            if zstandard is None:
+                raise ImportError(
+                    f'`{name}` was compressed with zstandard, '
+                    'please install it to pull this DocList'
+                )
+            stream = zstandard.ZstdDecompressor().stream_reader(raw)
+        else:
+            stream = gzip.GzipFile(fileobj=raw, mode='rb')
         source = _BufferedCachingReader(
-            open(f"s3://{bucket}/{name}.docs", 'rb', compression='.gz'),
+            stream,
             cache_path=cache_path if local_cache else None,
         )
 
@@ -221,7 +306,13 @@ class S3DocStore(AbstractDocStore):
                     logging.info(
                         f'Using cached file for {name} (size: {cache_path.stat().st_size})'
                     )
-                    source = open(cache_path, 'rb')
+                    # memory-map the cache file so the pickle parser reads
+                    # straight from the page cache without a user-space copy
+                    fd = os.open(cache_path, os.O_RDONLY)
+                    try:
+                        source = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+                    finally:
+                        os.close(fd)
 
         return _from_binary_stream(
             docs_cls.doc_type,
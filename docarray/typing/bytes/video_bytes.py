@@ -86,6 +86,8 @@ class VideoBytes(BaseBytes):
             audio = parse_obj_as(AudioNdArray, np.stack(audio_frames))
 
         video = parse_obj_as(VideoNdArray, np.stack(video_frames))
-        indices = parse_obj_as(NdArray, keyframe_indices)
+        # frame indices comfortably fit int32; half the footprint of the
+        # int64 numpy would infer from a python int list
+        indices = parse_obj_as(NdArray, np.asarray(keyframe_indices, dtype=np.int32))
 
         return VideoLoadResult(video=video, audio=audio, key_frame_indices=indices)
@@ -75,4 +75,8 @@ def __getattr__(name: str):
     if name not in __all__:
         __all__.append(name)
 
+    # bind into the module namespace so subsequent lookups resolve directly
+    # instead of re-entering this hook
+    globals()[name] = tensor_cls
+
     return tensor_cls
@@ -1,7 +1,7 @@
 import abc
 import warnings
 from abc import ABC
-from functools import reduce
+from functools import lru_cache, reduce
 from operator import mul
 from typing import (
     TYPE_CHECKING,
@@ -42,6 +42,19 @@ ShapeT = TypeVar('ShapeT')
 DISPLAY_TENSOR_OPENAPI_MAX_ITEMS = 256
 
 
+@lru_cache(maxsize=None)
+def _any_mro_subclass(instance_type: type, target: type) -> bool:
+    """Whether any class in ``instance_type``'s MRO subclasses ``target``.
+
+    isinstance checks on tensor types fire inside pydantic validation for
+    every tensor field of every document; the answer only depends on the two
+    classes, so the MRO walk is memoized.
+    """
+    return any(
+        safe_issubclass(candidate, target) for candidate in instance_type.__mro__
+    )
+
+
 class _ParametrizedMeta(type):
     """
     This metaclass ensures that instance, subclass and equality checks on parametrized Tensors
@@ -92,13 +105,10 @@ class _ParametrizedMeta(type):
                     != _cls.__docarray_target_shape__
                 ):
                     return False
-                return any(
-                    safe_issubclass(candidate, _cls.__unparametrizedcls__)
-                    for candidate in type(instance).__mro__
-                )
-            return any(
-                safe_issubclass(candidate, cls) for candidate in type(instance).__mro__
-            )
+                # keyed on the unparametrized class: parametrized classes are
+                # created on the fly and would bloat the memo
+                return _any_mro_subclass(type(instance), _cls.__unparametrizedcls__)
+            return _any_mro_subclass(type(instance), cls)
         return super().__instancecheck__(instance)
 
     def __eq__(cls, other):
@@ -292,7 +302,11 @@ class AbstractTensor(Generic[TTensor, T], AbstractType, ABC, Sized):
             field_schema['tensor/array shape'] = shape_info
 
     @classmethod
+    @lru_cache(maxsize=None)
     def _docarray_create_parametrized_type(cls: Type[T], shape: Tuple[int]):
+        # memoized per (class, shape): Tensor[128] in annotations and
+        # validation loops reuses one class instead of minting a new type
+        # (and MRO) on every subscript
         shape_str = ', '.join([str(s) for s in shape])
 
         class _ParametrizedTensor(
@@ -115,6 +115,11 @@ class NdArray(np.ndarray, AbstractTensor, Generic[ShapeT]):
         value: Union[T, np.ndarray, str, List[Any], Tuple[Any], Any],
     ) -> T:
 
+        if type(value) is np.ndarray:
+            # exact-type fast path for the most common input; skips the
+            # chain of isinstance checks below
+            return cls._docarray_from_native(value)
+
         if isinstance(value, str):
             value = orjson.loads(value)
 
@@ -131,7 +136,7 @@ class NdArray(np.ndarray, AbstractTensor, Generic[ShapeT]):
 
         elif jax_available and isinstance(value, jnp.ndarray):
             return cls._docarray_from_native(value.__array__())
-        elif isinstance(value, list) or isinstance(value, tuple):
+        elif isinstance(value, (list, tuple)):
             try:
                 arr_from_list: np.ndarray = np.asarray(value)
                 return cls._docarray_from_native(arr_from_list)
@@ -209,8 +214,9 @@ class NdArray(np.ndarray, AbstractTensor, Generic[ShapeT]):
         nd_proto = NdArrayProto()
 
         nd_proto.dense.buffer = self.tobytes()
-        nd_proto.dense.ClearField('shape')
-        nd_proto.dense.shape.extend(list(self.shape))
+        # the proto is freshly created, so the repeated shape field is empty;
+        # extend() takes the shape tuple directly without a list copy
+        nd_proto.dense.shape.extend(self.shape)
         nd_proto.dense.dtype = self.dtype.str
 
         return nd_proto
@@ -269,8 +269,9 @@ class TorchTensor(
 
         value_np = self.detach().cpu().numpy()
         nd_proto.dense.buffer = value_np.tobytes()
-        nd_proto.dense.ClearField('shape')
-        nd_proto.dense.shape.extend(list(value_np.shape))
+        # the proto is freshly created, so the repeated shape field is empty;
+        # extend() takes the shape tuple directly without a list copy
+        nd_proto.dense.shape.extend(value_np.shape)
         nd_proto.dense.dtype = value_np.dtype.str
 
         return nd_proto
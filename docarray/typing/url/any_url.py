@@ -1,13 +1,16 @@
 import mimetypes
 import os
 import urllib
+import urllib.error
 import urllib.parse
 import urllib.request
-from typing import TYPE_CHECKING, Any, List, Optional, Type, TypeVar, Union
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, FrozenSet, List, Optional, Type, TypeVar, Union
 
 import numpy as np
 from pydantic import AnyUrl as BaseAnyUrl
-from pydantic import errors, parse_obj_as
+from pydantic import errors
 
 from docarray.typing.abstract_type import AbstractType
 from docarray.typing.proto_register import _register_proto
@@ -31,6 +34,139 @@ T = TypeVar('T', bound='AnyUrl')
 
 mimetypes.init([])
 
+# scheme prefixes that mark a url as remote rather than a local path;
+# matched against a lowercased slice so the check is a few C comparisons
+_HTTP_PREFIXES = ('http://', 'https://')
+_REMOTE_PREFIXES = ('http://', 'https://', 'data:')
+
+# default timeout for remote fetches, so one hung server cannot stall the
+# process indefinitely; override per call or via the environment
+DEFAULT_URL_TIMEOUT = float(os.environ.get('DOCARRAY_URL_TIMEOUT', '10.0'))
+
+# lazily created urllib3 pool shared by all load_bytes calls, so fetching
+# many urls from the same host reuses keep-alive connections instead of
+# paying a TCP+TLS handshake per request
+_HTTP_POOL: Optional[Any] = None
+
+
+def _get_http_pool() -> Optional[Any]:
+    global _HTTP_POOL
+    if _HTTP_POOL is None:
+        try:
+            import urllib3
+        except ImportError:
+            return None
+        _HTTP_POOL = urllib3.PoolManager(
+            num_pools=16, maxsize=32, headers={'User-Agent': 'Mozilla/5.0'}
+        )
+    return _HTTP_POOL
+
+
+@lru_cache(maxsize=None)
+def _extra_extensions_set(cls: type) -> FrozenSet[str]:
+    # extra_extensions() is fixed per class but can hold dozens of entries
+    # (e.g. meshes); a memoized frozenset makes the membership test O(1)
+    return frozenset(cls.extra_extensions())
+
+
+def _load_bytes_from_url(url: str, timeout: Optional[float] = None) -> bytes:
+    if timeout is None:
+        timeout = DEFAULT_URL_TIMEOUT
+    # a lowercased prefix test replaces the full urlparse: the scheme is all
+    # this function needs, and urlparse regex-scans the whole string
+    prefix = url[:8].lower()
+    if prefix.startswith(_HTTP_PREFIXES):
+        pool = _get_http_pool()
+        if pool is not None:
+            import urllib3
+
+            try:
+                response = pool.request('GET', url, timeout=timeout)
+            except urllib3.exceptions.HTTPError as e:
+                # keep the exception contract of the old urlopen path
+                raise urllib.error.URLError(e) from e
+            if response.status >= 400:
+                # keep raising the exception type the urlopen path produced
+                raise urllib.error.HTTPError(
+                    url, response.status, response.reason or '', response.headers, None  # type: ignore[arg-type]
+                )
+            return response.data
+    if prefix.startswith(_REMOTE_PREFIXES):
+        # data: urls, or http without urllib3 available
+        req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
+        urlopen_kwargs = {'timeout': timeout} if timeout is not None else {}
+        with urllib.request.urlopen(req, **urlopen_kwargs) as fp:  # type: ignore
+            return fp.read()
+    # EAFP: one os.open instead of a stat + open pair (and no TOCTOU window);
+    # a raw fd read also skips the BufferedReader layer that open() sets up
+    # for what is a single full-file read anyway
+    try:
+        fd = os.open(url, os.O_RDONLY)
+    except (FileNotFoundError, ValueError):
+        # ValueError covers strings os.open rejects outright (e.g. NUL bytes)
+        raise FileNotFoundError(f'`{url}` is not a URL or a valid local path')
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size) if size else b''
+        if len(data) == size and size:
+            # regular-file fast path: one read got everything
+            return data
+        # short read, or a size-reporting-zero special file: drain to EOF
+        chunks = [data]
+        while True:
+            chunk = os.read(fd, 2**20)
+            if not chunk:
+                return b''.join(chunks)
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+
+
+def _load_bytes_many(
+    urls: List[str],
+    timeout: Optional[float] = None,
+    max_workers: int = 16,
+) -> List[bytes]:
+    urls = list(urls)
+    if len(urls) <= 1:
+        return [_load_bytes_maybe_cached(url, timeout=timeout) for url in urls]
+    # the fetches are independent network/disk round-trips, so overlap
+    # them; the shared PoolManager reuses connections across workers
+    with ThreadPoolExecutor(max_workers=min(len(urls), max_workers)) as executor:
+        return list(
+            executor.map(
+                lambda url: _load_bytes_maybe_cached(url, timeout=timeout), urls
+            )
+        )
+
+
+# opt-in LRU for load_bytes, for pipelines that fetch the same small
+# assets (icons, vocab files, reference meshes) over and over; disabled
+# by default since cached blobs stay pinned in memory
+_URL_CACHE_SIZE = int(os.environ.get('DOCARRAY_URL_CACHE', '0'))
+
+if _URL_CACHE_SIZE > 0:
+
+    @lru_cache(maxsize=_URL_CACHE_SIZE)
+    def _cached_fetch(url: str, timeout: Optional[float], _mtime_ns: int) -> bytes:
+        # _mtime_ns is part of the cache key so local-file entries are
+        # invalidated when the file changes; it is -1 for remote urls
+        return _load_bytes_from_url(url, timeout=timeout)
+
+
+def _load_bytes_maybe_cached(url: str, timeout: Optional[float] = None) -> bytes:
+    if not _URL_CACHE_SIZE:
+        return _load_bytes_from_url(url, timeout=timeout)
+    if url[:8].lower().startswith(_REMOTE_PREFIXES):
+        mtime_ns = -1
+    else:
+        try:
+            mtime_ns = os.stat(url).st_mtime_ns
+        except OSError:
+            return _load_bytes_from_url(url, timeout=timeout)
+    return _cached_fetch(url, timeout, mtime_ns)
+
+
 # TODO need refactoring here
 # - code is duplicate in both version
 # - validation is very dummy for pydantic v2
@@ -64,21 +200,26 @@ if is_pydantic_v2:
         def load_bytes(self, timeout: Optional[float] = None) -> bytes:
             """Convert url to bytes. This will either load or download the file and save
             it into a bytes object.
-            :param timeout: timeout for urlopen. Only relevant if URI is not local
+            :param timeout: timeout for the request. Only relevant if URI is not local
             :return: bytes.
             """
-            if urllib.parse.urlparse(self).scheme in {'http', 'https', 'data'}:
-                req = urllib.request.Request(
-                    self, headers={'User-Agent': 'Mozilla/5.0'}
-                )
-                urlopen_kwargs = {'timeout': timeout} if timeout is not None else {}
-                with urllib.request.urlopen(req, **urlopen_kwargs) as fp:  # type: ignore
-                    return fp.read()
-            elif os.path.exists(self):
-                with open(self, 'rb') as fp:
-                    return fp.read()
-            else:
-                raise FileNotFoundError(f'`{self}` is not a URL or a valid local path')
+            return _load_bytes_maybe_cached(self, timeout=timeout)
+
+        @classmethod
+        def load_bytes_many(
+            cls,
+            urls: List[str],
+            timeout: Optional[float] = None,
+            max_workers: int = 16,
+        ) -> List[bytes]:
+            """Load or download several urls concurrently.
+            Results are returned in input order.
+            :param urls: the urls or local paths to load
+            :param timeout: timeout per request. Only relevant for remote urls
+            :param max_workers: upper bound on concurrent fetches
+            :return: list of bytes, one entry per url
+            """
+            return _load_bytes_many(urls, timeout=timeout, max_workers=max_workers)
 
         def _to_node_protobuf(self) -> 'NodeProto':
             """Convert Document into a NodeProto protobuf message. This function should
@@ -98,7 +239,9 @@ if is_pydantic_v2:
             :param pb_msg:
             :return: url
             """
-            return parse_obj_as(cls, pb_msg)
+            # the value was validated before serialization, so construct
+            # directly instead of re-running pydantic validation
+            return cls(pb_msg)
 
         @classmethod
         def is_extension_allowed(cls, value: Any) -> bool:
@@ -123,7 +266,9 @@ if is_pydantic_v2:
             if mimetype and mimetype.startswith(cls.mime_type()):
                 return True
 
-            return extension in cls.extra_extensions()
+            # extension lists are lowercase; compare case-insensitively so
+            # 'model.OBJ' is treated like 'model.obj' (mimetypes already is)
+            return extension.lower() in _extra_extensions_set(cls)
 
         @staticmethod
         def _get_url_extension(url: str) -> str:
@@ -212,7 +357,9 @@ else:
             if mimetype and mimetype.startswith(cls.mime_type()):
                 return True
 
-            return extension in cls.extra_extensions()
+            # extension lists are lowercase; compare case-insensitively so
+            # 'model.OBJ' is treated like 'model.obj' (mimetypes already is)
+            return extension.lower() in _extra_extensions_set(cls)
 
         @classmethod
         def validate(
@@ -221,8 +368,6 @@ else:
             field: 'ModelField',
             config: 'BaseConfig',
         ) -> T:
-            import os
-
             abs_path: Union[T, np.ndarray, Any]
             if (
                 isinstance(value, str)
@@ -315,23 +460,30 @@ else:
             :param pb_msg:
             :return: url
             """
-            return parse_obj_as(cls, pb_msg)
+            # the value was validated before serialization, so construct
+            # directly; scheme=None matches what validate returns
+            return cls(pb_msg, scheme=None)
 
         def load_bytes(self, timeout: Optional[float] = None) -> bytes:
             """Convert url to bytes. This will either load or download the file and save
             it into a bytes object.
-            :param timeout: timeout for urlopen. Only relevant if URI is not local
+            :param timeout: timeout for the request. Only relevant if URI is not local
             :return: bytes.
             """
-            if urllib.parse.urlparse(self).scheme in {'http', 'https', 'data'}:
-                req = urllib.request.Request(
-                    self, headers={'User-Agent': 'Mozilla/5.0'}
-                )
-                urlopen_kwargs = {'timeout': timeout} if timeout is not None else {}
-                with urllib.request.urlopen(req, **urlopen_kwargs) as fp:  # type: ignore
-                    return fp.read()
-            elif os.path.exists(self):
-                with open(self, 'rb') as fp:
-                    return fp.read()
-            else:
-                raise FileNotFoundError(f'`{self}` is not a URL or a valid local path')
+            return _load_bytes_maybe_cached(self, timeout=timeout)
+
+        @classmethod
+        def load_bytes_many(
+            cls,
+            urls: List[str],
+            timeout: Optional[float] = None,
+            max_workers: int = 16,
+        ) -> List[bytes]:
+            """Load or download several urls concurrently.
+            Results are returned in input order.
+            :param urls: the urls or local paths to load
+            :param timeout: timeout per request. Only relevant for remote urls
+            :param max_workers: upper bound on concurrent fetches
+            :return: list of bytes, one entry per url
+            """
+            return _load_bytes_many(urls, timeout=timeout, max_workers=max_workers)
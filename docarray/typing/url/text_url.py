@@ -16,7 +16,7 @@
 from typing import List, Optional, TypeVar
 
 from docarray.typing.proto_register import _register_proto
-from docarray.typing.url.any_url import AnyUrl
+from docarray.typing.url.any_url import _REMOTE_PREFIXES, AnyUrl
 from docarray.typing.url.mimetypes import TEXT_EXTRA_EXTENSIONS, TEXT_MIMETYPE
 
 T = TypeVar('T', bound='TextUrl')
@@ -72,5 +72,15 @@ class TextUrl(AnyUrl):
         :param charset: decoding charset; may be any character set registered with IANA
         :return: the text file content
         """
+        if not self[:8].lower().startswith(_REMOTE_PREFIXES):
+            # local file: decode during the read, so the raw bytes and the
+            # decoded string are never held in memory at the same time;
+            # newline='' keeps line endings untranslated, like bytes.decode
+            try:
+                fp = open(self, 'r', encoding=charset, newline='')
+            except (FileNotFoundError, ValueError):
+                raise FileNotFoundError(f'`{self}` is not a URL or a valid local path')
+            with fp:
+                return fp.read()
         _bytes = self.load_bytes(timeout=timeout)
         return _bytes.decode(charset)
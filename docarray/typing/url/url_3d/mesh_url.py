@@ -86,8 +86,11 @@ class Mesh3DUrl(Url3D):
             force='mesh', skip_materials=skip_materials, **trimesh_args
         )
 
-        vertices = parse_obj_as(NdArray, mesh.vertices.view(np.ndarray))
-        faces = parse_obj_as(NdArray, mesh.faces.view(np.ndarray))
+        # np.asarray drops trimesh's TrackedArray subclass (and its
+        # write-callback hooks) without copying, same as .view(np.ndarray)
+        # but without the stride-compatibility assertion
+        vertices = parse_obj_as(NdArray, np.asarray(mesh.vertices))
+        faces = parse_obj_as(NdArray, np.asarray(mesh.faces))
 
         return VerticesAndFaces(vertices=vertices, faces=faces)
 
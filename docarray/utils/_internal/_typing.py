@@ -13,12 +13,16 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from functools import lru_cache
 from typing import Any, ForwardRef, Optional, Union
 
 from typing_extensions import get_origin
 from typing_inspect import get_args, is_typevar, is_union_type
 
 
+# both checks are pure functions of the (hashable) type object and sit on
+# per-field schema-walking paths, so memoize them
+@lru_cache(maxsize=None)
 def is_type_tensor(type_: Any) -> bool:
     """Return True if type is a type Tensor or an Optional Tensor type."""
     from docarray.typing.tensor.abstract_tensor import AbstractTensor
@@ -26,6 +30,7 @@ def is_type_tensor(type_: Any) -> bool:
     return isinstance(type_, type) and safe_issubclass(type_, AbstractTensor)
 
 
+@lru_cache(maxsize=None)
 def is_tensor_union(type_: Any) -> bool:
     """Return True if type is a Union of type Tensors."""
     is_union = is_union_type(type_)
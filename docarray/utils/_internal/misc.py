@@ -2,32 +2,14 @@ import importlib
 import os
 import re
 import types
+from functools import lru_cache
 from typing import Any, Literal, Optional
 
-import numpy as np
-
-try:
-    import torch  # noqa: F401
-except ImportError:
-    torch_imported = False
-else:
-    torch_imported = True
-
-
-try:
-    import tensorflow as tf  # type: ignore # noqa: F401
-except (ImportError, TypeError):
-    tf_imported = False
-else:
-    tf_imported = True
-
-
-try:
-    import jax.numpy as jnp  # type: ignore # noqa: F401
-except (ImportError, TypeError):
-    jnp_imported = False
-else:
-    jnp_imported = True
+# import probes are deferred to the first is_*_available() call so that
+# loading this module does not pay for torch/tensorflow/jax imports
+_torch_imported: Optional[bool] = None
+_tf_imported: Optional[bool] = None
+_jnp_imported: Optional[bool] = None
 
 INSTALL_INSTRUCTIONS = {
     'google.protobuf': '"docarray[proto]"',
@@ -45,7 +27,6 @@ INSTALL_INSTRUCTIONS = {
     'fastapi': '"docarray[web]"',
     'torch': '"docarray[torch]"',
     'tensorflow': 'protobuf==3.19.0 tensorflow',
-    'smart_open': '"docarray[aws]"',
     'boto3': '"docarray[aws]"',
     'botocore': '"docarray[aws]"',
     'redis': '"docarray[redis]"',
@@ -83,33 +64,63 @@ def _get_path_from_docarray_root_level(file_path: str) -> str:
 
 
 def is_torch_available():
-    return torch_imported
+    global _torch_imported
+    if _torch_imported is None:
+        try:
+            import torch  # noqa: F401
+        except ImportError:
+            _torch_imported = False
+        else:
+            _torch_imported = True
+    return _torch_imported
 
 
 def is_tf_available():
-    return tf_imported
+    global _tf_imported
+    if _tf_imported is None:
+        try:
+            import tensorflow as tf  # type: ignore # noqa: F401
+        except (ImportError, TypeError):
+            _tf_imported = False
+        else:
+            _tf_imported = True
+    return _tf_imported
 
 
 def is_jax_available():
-    return jnp_imported
+    global _jnp_imported
+    if _jnp_imported is None:
+        try:
+            import jax.numpy as jnp  # type: ignore # noqa: F401
+        except (ImportError, TypeError):
+            _jnp_imported = False
+        else:
+            _jnp_imported = True
+    return _jnp_imported
 
 
 def is_np_int(item: Any) -> bool:
+    if item.__class__ is int:
+        # plain python ints are the common case and are never numpy scalars
+        return False
     dtype = getattr(item, 'dtype', None)
-    ndim = getattr(item, 'ndim', None)
-    if dtype is not None and ndim is not None:
-        try:
-            return ndim == 0 and np.issubdtype(dtype, np.integer)
-        except TypeError:
-            return False
-    return False  # this is unreachable, but mypy wants it
+    if dtype is None:
+        return False
+    # comparing dtype.kind (a single char) is much cheaper than
+    # np.issubdtype, which walks the numpy type hierarchy; non-numpy
+    # dtypes (e.g. torch) have no `kind` and fall through to False
+    return getattr(dtype, 'kind', None) in ('i', 'u') and getattr(item, 'ndim', 1) == 0
 
 
+@lru_cache(maxsize=1)
 def is_notebook() -> bool:
     """
     Check if we're running in a Jupyter notebook, using magic command
     `get_ipython` that only available in Jupyter.
 
+    The kind of shell cannot change during the lifetime of the process,
+    so the result is cached after the first call.
+
     :return: True if run in a Jupyter notebook else False.
     """
 
@@ -1,4 +1,5 @@
 __all__ = ['map_docs', 'map_docs_batched']
+import os
 from contextlib import nullcontext
 from math import ceil
 from multiprocessing.pool import Pool, ThreadPool
@@ -13,6 +14,24 @@ from docarray.helper import _is_lambda_or_partial_or_local_function
 T = TypeVar('T', bound=AnyDocArray)
 T_doc = TypeVar('T_doc', bound=BaseDoc)
 
+# below this many docs, spinning up a pool costs more than it saves and a
+# plain loop is faster
+_MIN_PARALLEL_DOCS = 16
+
+
+def _default_num_worker() -> int:
+    """
+    Number of CPUs actually available to this process.
+
+    os.cpu_count() reports the node's CPUs, which oversubscribes the pool
+    under cgroup/affinity limits (containers, SLURM); honor the scheduler
+    affinity where the platform exposes it.
+    """
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # macOS/Windows
+        return os.cpu_count() or 1
+
 
 def map_docs(
     docs: T,
@@ -89,6 +108,15 @@ def map_docs(
             f'Multiprocessing does not allow functions that are local, lambda or partial: {func}'
         )
 
+    if (
+        pool is None
+        and backend in ('thread', 'process')
+        and len(docs) < _MIN_PARALLEL_DOCS
+    ):
+        for doc in track(docs, total=len(docs), disable=not show_progress):
+            yield func(doc)
+        return
+
     context_pool: Union[nullcontext, Union[Pool, ThreadPool]]
     if pool:
         p = pool
@@ -98,7 +126,11 @@ def map_docs(
         context_pool = p
 
     with context_pool:
-        imap = p.imap(func, docs)
+        # dispatching docs in chunks amortizes the per-item IPC/pickling
+        # cost when func itself is cheap; imap still yields in order
+        n_worker = num_worker or getattr(p, '_processes', None) or _default_num_worker()
+        chunksize = max(1, len(docs) // (n_worker + 2))
+        imap = p.imap(func, docs, chunksize=chunksize)
         for x in track(imap, total=len(docs), disable=not show_progress):
             yield x
 
@@ -187,6 +219,17 @@ def map_docs_batched(
             f'Multiprocessing does not allow functions that are local, lambda or partial: {func}'
         )
 
+    if (
+        pool is None
+        and backend in ('thread', 'process')
+        and ceil(len(docs) / batch_size) < 2
+    ):
+        # a single batch gains nothing from a pool
+        batches = docs._batch(batch_size=batch_size, shuffle=shuffle)
+        for batch in track(batches, total=1, disable=not show_progress):
+            yield func(batch)
+        return
+
     context_pool: Union[nullcontext, Union[Pool, ThreadPool]]
     if pool:
         p = pool
@@ -208,8 +251,14 @@ def _get_pool(backend, num_worker) -> Union[Pool, ThreadPool]:
     Get Pool instance for multiprocessing or ThreadPool instance for multithreading.
     """
     if backend == 'thread':
+        if num_worker is None:
+            # thread workloads are IO-bound or release the GIL (image
+            # decode, HTTP), so threads can healthily outnumber cores
+            num_worker = min(32, 4 * _default_num_worker())
         return ThreadPool(processes=num_worker)
     elif backend == 'process':
+        if num_worker is None:
+            num_worker = _default_num_worker()
         return Pool(processes=num_worker)
     else:
         raise ValueError(
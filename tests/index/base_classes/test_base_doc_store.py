@@ -12,7 +12,7 @@ from docarray.documents import ImageDoc
 from docarray.index.abstract import BaseDocIndex, _raise_not_composable
 from docarray.typing import ID, ImageBytes, ImageUrl, NdArray
 from docarray.typing.tensor.abstract_tensor import AbstractTensor
-from docarray.utils._internal.misc import torch_imported
+from docarray.utils._internal.misc import is_torch_available
 
 pytestmark = pytest.mark.index
 
@@ -390,7 +390,7 @@ def test_flatten_schema_union():
     fields = MyDoc._docarray_fields()
     fields_image = ImageDoc._docarray_fields()
 
-    if torch_imported:
+    if is_torch_available():
         from docarray.typing.tensor.image.image_torch_tensor import ImageTorchTensor
 
     assert set(index._flatten_schema(MyDoc)) == {
@@ -876,7 +876,7 @@ def test_convert_dict_to_doc():
     }
     doc = index._convert_dict_to_doc(doc_dict, index._schema)
 
-    if torch_imported:
+    if is_torch_available():
         from docarray.typing.tensor.image.image_torch_tensor import ImageTorchTensor
 
     class MyDoc2(BaseDoc):
@@ -0,0 +1,81 @@
+import gzip
+import io
+
+import pytest
+
+import docarray.store.s3 as s3_store
+from docarray.store.s3 import ZSTD_MAGIC, _ChainedReader, _CompressedStreamReader
+
+zstandard = pytest.importorskip('zstandard')
+
+PAYLOAD_CHUNKS = [b'hello ', b'world ' * 100, b'', b'\x00\x01\x02' * 50]
+PAYLOAD = b''.join(PAYLOAD_CHUNKS)
+
+
+def _read_all(reader, size: int = -1) -> bytes:
+    if size < 0:
+        return reader.read()
+    out = bytearray()
+    while True:
+        chunk = reader.read(size)
+        if not chunk:
+            return bytes(out)
+        out += chunk
+
+
+def _sniff_and_decompress(compressed: bytes) -> bytes:
+    """Reproduce the magic-byte dispatch pull_stream performs."""
+    body = io.BytesIO(compressed)
+    magic = body.read(4)
+    raw = _ChainedReader(magic, body)
+    if magic.startswith(ZSTD_MAGIC):
+        return _read_all(zstandard.ZstdDecompressor().stream_reader(raw))
+    return _read_all(gzip.GzipFile(fileobj=raw, mode='rb'))  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize('read_size', [-1, 1, 7, 8 * 2**20])
+def test_zstd_roundtrip(read_size):
+    reader = _CompressedStreamReader(iter(PAYLOAD_CHUNKS))
+    compressed = _read_all(reader, read_size)
+    assert compressed.startswith(ZSTD_MAGIC)
+    assert _sniff_and_decompress(compressed) == PAYLOAD
+
+
+@pytest.mark.parametrize('read_size', [-1, 1, 7, 8 * 2**20])
+def test_gzip_fallback_roundtrip(monkeypatch, read_size):
+    # simulate zstandard not being installed: push must fall back to gzip
+    monkeypatch.setattr(s3_store, 'zstandard', None)
+    reader = _CompressedStreamReader(iter(PAYLOAD_CHUNKS))
+    compressed = _read_all(reader, read_size)
+    assert compressed.startswith(b'\x1f\x8b')  # gzip magic
+    assert not compressed.startswith(ZSTD_MAGIC)
+    assert _sniff_and_decompress(compressed) == PAYLOAD
+
+
+def test_pull_legacy_gzip_object():
+    # objects pushed before the zstd change were written by GzipFile
+    buf = io.BytesIO()
+    with gzip.GzipFile(fileobj=buf, mode='wb') as fp:
+        fp.write(PAYLOAD)
+    assert _sniff_and_decompress(buf.getvalue()) == PAYLOAD
+
+
+def test_gzip_fallback_matches_gzipfile_container(monkeypatch):
+    # the zlib-based fallback must stay readable by plain gzip.decompress
+    monkeypatch.setattr(s3_store, 'zstandard', None)
+    compressed = _read_all(_CompressedStreamReader(iter(PAYLOAD_CHUNKS)))
+    assert gzip.decompress(compressed) == PAYLOAD
+
+
+@pytest.mark.parametrize('size', [-1, 1, 2, 4, 100])
+def test_chained_reader_preserves_stream(size):
+    head, tail = PAYLOAD[:4], PAYLOAD[4:]
+    reader = _ChainedReader(head, io.BytesIO(tail))
+    assert _read_all(reader, size) == PAYLOAD
+
+
+def test_chained_reader_read_across_boundary():
+    reader = _ChainedReader(b'abcd', io.BytesIO(b'efgh'))
+    assert reader.read(6) == b'abcdef'
+    assert reader.read() == b'gh'
+    assert reader.read() == b''
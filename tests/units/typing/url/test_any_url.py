@@ -42,6 +42,25 @@ def test_operators():
     assert 'docarray' not in url
 
 
+def test_load_bytes_many(tmp_path):
+    paths = []
+    for i in range(5):
+        path = tmp_path / f'file_{i}.txt'
+        path.write_bytes(f'content {i}'.encode())
+        paths.append(str(path))
+
+    # results come back in input order, even with concurrent fetches
+    assert AnyUrl.load_bytes_many(paths) == [f'content {i}'.encode() for i in range(5)]
+
+    # single url takes the serial path
+    assert AnyUrl.load_bytes_many(paths[:1]) == [b'content 0']
+
+    assert AnyUrl.load_bytes_many([]) == []
+
+    with pytest.raises(FileNotFoundError):
+        AnyUrl.load_bytes_many([paths[0], str(tmp_path / 'missing.txt')])
+
+
 def test_get_url_extension():
     # Test with a URL with extension
     assert AnyUrl._get_url_extension('https://jina.ai/hey.md?model=gpt-4') == 'md'